@@ -1,7 +1,298 @@
-from typing import Union, List, Tuple
+from typing import Dict, Iterator, Union, List, Tuple
+import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import breadth_first_order
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import os
 import random
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency, the path search falls back to pure Python
+    njit = None
+
+
+def _to_node_list(nodes: Union[str, pd.DataFrame, List[str]]) -> List[str]:
+    """
+    Convert the start or end nodes of a path search (a node, a list of nodes or a DataFrame with a 'name_of_node'
+    column) to a list of nodes.
+    """
+    if isinstance(nodes, str):
+        return [nodes]
+    elif isinstance(nodes, pd.DataFrame):
+        return nodes['name_of_node'].tolist()
+    elif isinstance(nodes, list) and all(isinstance(item, str) for item in nodes):
+        return nodes
+    else:
+        raise ValueError("Invalid type for 'start' variable")
+
+
+# Maximum number of find_paths results kept in the cache of a Connections object
+_PATHS_CACHE_SIZE = 100_000
+
+
+def _iter_paths(indptr: np.ndarray,
+               indices: np.ndarray,
+               src: int,
+               tgt: int,
+               maxlen: int,
+               minlen: int = 1) -> Iterator[List[int]]:
+    """
+    Enumerate lazily all the simple paths between two nodes of a CSR adjacency, using an iterative depth-first
+    search bounded by maxlen. Only the current path is kept in memory, each path is yielded when found.
+
+    Args:
+        indptr: The CSR index pointer array.
+        indices: The CSR column indices array.
+        src: The index of the start node.
+        tgt: The index of the end node.
+        maxlen: The maximum number of edges in a path.
+        minlen: The minimum number of edges in a path.
+
+    Yields:
+        The paths, each path being a list of node indices.
+    """
+    path = [src]
+    on_path = np.zeros(len(indptr) - 1, dtype=bool)
+    on_path[src] = True
+    # Position of the next neighbour to visit for each node of the current path
+    positions = [indptr[src]]
+
+    while positions:
+        node = path[-1]
+        pos = positions[-1]
+        if pos == indptr[node + 1] or len(path) > maxlen:
+            positions.pop()
+            on_path[path.pop()] = False
+            continue
+        positions[-1] = pos + 1
+        neighbour = indices[pos]
+        if on_path[neighbour]:
+            continue
+        if neighbour == tgt:
+            if len(path) >= minlen:
+                yield path + [neighbour]
+            continue
+        path.append(neighbour)
+        on_path[neighbour] = True
+        positions.append(indptr[neighbour])
+
+
+def _iter_paths_multi(indptr: np.ndarray,
+                      indices: np.ndarray,
+                      src: int,
+                      is_target: np.ndarray,
+                      maxlen: int,
+                      minlen: int = 1) -> Iterator[List[int]]:
+    """
+    Enumerate lazily all the simple paths from a node of a CSR adjacency to any node of a set of targets, with a
+    single iterative depth-first search bounded by maxlen. Unlike `_iter_paths`, the search continues through the
+    targets, so the paths to a target can pass through other targets. The paths to each target are yielded in the
+    same order as `_iter_paths`.
+
+    Args:
+        indptr: The CSR index pointer array.
+        indices: The CSR column indices array.
+        src: The index of the start node.
+        is_target: A boolean array, True for the indices of the target nodes.
+        maxlen: The maximum number of edges in a path.
+        minlen: The minimum number of edges in a path.
+
+    Yields:
+        The paths, each path being a list of node indices ending with a target.
+    """
+    path = [src]
+    on_path = np.zeros(len(indptr) - 1, dtype=bool)
+    on_path[src] = True
+    positions = [indptr[src]]
+
+    while positions:
+        node = path[-1]
+        pos = positions[-1]
+        if pos == indptr[node + 1] or len(path) > maxlen:
+            positions.pop()
+            on_path[path.pop()] = False
+            continue
+        positions[-1] = pos + 1
+        neighbour = indices[pos]
+        if on_path[neighbour]:
+            continue
+        if is_target[neighbour] and len(path) >= minlen:
+            yield path + [neighbour]
+        path.append(neighbour)
+        on_path[neighbour] = True
+        positions.append(indptr[neighbour])
+
+
+def _enumerate_paths(indptr: np.ndarray,
+                     indices: np.ndarray,
+                     src: int,
+                     tgt: int,
+                     maxlen: int,
+                     minlen: int = 1) -> List[List[int]]:
+    """
+    Enumerate all the simple paths between two nodes of a CSR adjacency, see `_iter_paths`.
+
+    Returns:
+        List of paths, each path being a list of node indices.
+    """
+    return list(_iter_paths(indptr, indices, src, tgt, maxlen, minlen))
+
+
+def _enumerate_paths_flat(indptr: np.ndarray,
+                          indices: np.ndarray,
+                          src: int,
+                          tgt: int,
+                          maxlen: int,
+                          minlen: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array-only version of `_enumerate_paths`, written to be compiled by numba: the paths are returned concatenated
+    in a flat array, with the offsets of the start of each path (and of the end of the last one).
+
+    Args:
+        indptr: The CSR index pointer array.
+        indices: The CSR column indices array.
+        src: The index of the start node.
+        tgt: The index of the end node.
+        maxlen: The maximum number of edges in a path.
+        minlen: The minimum number of edges in a path.
+
+    Returns:
+        The flat int32 array of the node indices of the paths, and the int64 array of the path offsets.
+    """
+    on_path = np.zeros(len(indptr) - 1, dtype=np.bool_)
+    path = np.empty(maxlen + 1, dtype=np.int32)
+    positions = np.empty(maxlen + 1, dtype=np.int64)
+    flat = np.empty(64, dtype=np.int32)
+    offsets = np.zeros(16, dtype=np.int64)
+    n_paths = 0
+    size = 0
+
+    depth = 0
+    path[0] = src
+    on_path[src] = True
+    positions[0] = indptr[src]
+    while depth >= 0:
+        node = path[depth]
+        pos = positions[depth]
+        if pos == indptr[node + 1] or depth + 1 > maxlen:
+            on_path[node] = False
+            depth -= 1
+            continue
+        positions[depth] = pos + 1
+        neighbour = indices[pos]
+        if on_path[neighbour]:
+            continue
+        if neighbour == tgt:
+            if depth + 1 >= minlen:
+                # Grow the output buffers geometrically
+                while size + depth + 2 > len(flat):
+                    grown = np.empty(2 * len(flat), dtype=np.int32)
+                    grown[:size] = flat[:size]
+                    flat = grown
+                if n_paths + 2 > len(offsets):
+                    grown_offsets = np.zeros(2 * len(offsets), dtype=np.int64)
+                    grown_offsets[:n_paths + 1] = offsets[:n_paths + 1]
+                    offsets = grown_offsets
+                flat[size:size + depth + 1] = path[:depth + 1]
+                flat[size + depth + 1] = neighbour
+                size += depth + 2
+                n_paths += 1
+                offsets[n_paths] = size
+            continue
+        depth += 1
+        path[depth] = neighbour
+        on_path[neighbour] = True
+        positions[depth] = indptr[neighbour]
+
+    return flat[:size], offsets[:n_paths + 1]
+
+
+# Compiled path enumeration, available when numba is installed
+_enumerate_paths_jit = njit(cache=True, nogil=True)(_enumerate_paths_flat) if njit is not None else None
+
+
+def _ragged_arange(counts: np.ndarray) -> np.ndarray:
+    """
+    Concatenate np.arange(c) for each c in counts.
+    """
+    return np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+
+def _expand_frontier(layer: np.ndarray, indptr: np.ndarray, indices: np.ndarray, stop: int) -> np.ndarray:
+    """
+    Extend every partial path (row) of a frontier by one edge, keeping only the simple paths. The partial paths
+    ending in the stop node are not extended.
+
+    Args:
+        layer: A 2D int32 array, one partial path per row.
+        indptr: The CSR index pointer array.
+        indices: The CSR column indices array.
+        stop: The index of the node at which the partial paths end.
+
+    Returns:
+        The 2D int32 array of the extended partial paths.
+    """
+    last = layer[:, -1]
+    starts = indptr[last]
+    counts = indptr[last + 1] - starts
+    counts[last == stop] = 0
+    rows = np.repeat(np.arange(len(layer)), counts)
+    neighbours = indices[np.repeat(starts, counts) + _ragged_arange(counts)]
+    extended = np.hstack([layer[rows], neighbours[:, None]])
+    return extended[(extended[:, :-1] != neighbours[:, None]).all(axis=1)]
+
+
+def _bidirectional_paths(indptr: np.ndarray,
+                         indices: np.ndarray,
+                         indptr_t: np.ndarray,
+                         indices_t: np.ndarray,
+                         src: int,
+                         tgt: int,
+                         maxlen: int,
+                         minlen: int = 1) -> List[np.ndarray]:
+    """
+    Enumerate all the simple paths between two nodes of a CSR adjacency with a bidirectional search. A forward
+    frontier grows from src over the adjacency and a backward frontier grows from tgt over its transpose, each one
+    up to half of maxlen; the paths are obtained joining the two frontiers on their meeting node.
+
+    Args:
+        indptr: The CSR index pointer array.
+        indices: The CSR column indices array.
+        indptr_t: The index pointer array of the transposed adjacency.
+        indices_t: The column indices array of the transposed adjacency.
+        src: The index of the start node.
+        tgt: The index of the end node.
+        maxlen: The maximum number of edges in a path.
+        minlen: The minimum number of edges in a path.
+
+    Returns:
+        List of 2D int32 arrays, one per path length, with one path per row.
+    """
+    forward = [np.array([[src]], dtype=np.int32)]
+    backward = [np.array([[tgt]], dtype=np.int32)]
+    # Alternate the growth of the two frontiers
+    while len(forward) + len(backward) - 2 < maxlen:
+        if len(forward) <= len(backward):
+            forward.append(_expand_frontier(forward[-1], indptr, indices, tgt))
+        else:
+            backward.append(_expand_frontier(backward[-1], indptr_t, indices_t, src))
+
+    paths = []
+    for length in range(minlen, maxlen + 1):
+        head = forward[(length + 1) // 2]
+        # The backward partial paths are stored from tgt, reverse them to start from the meeting node
+        tail = backward[length // 2][:, ::-1]
+        tail = tail[np.argsort(tail[:, 0], kind="stable")]
+        lo = np.searchsorted(tail[:, 0], head[:, -1], side="left")
+        counts = np.searchsorted(tail[:, 0], head[:, -1], side="right") - lo
+        joined = np.hstack([head[np.repeat(np.arange(len(head)), counts)],
+                            tail[np.repeat(lo, counts) + _ragged_arange(counts), 1:]])
+        ordered = np.sort(joined, axis=1)
+        paths.append(joined[(ordered[:, 1:] != ordered[:, :-1]).all(axis=1)])
+
+    return paths
 
 
 class Connections:
@@ -13,8 +304,32 @@ class Connections:
 
     def __init__(self, database: pd.DataFrame):
         self.resources = database.copy()
-        self.target_neighbours_map = self._preprocess_target_neighbours()
-        self.source_neighbours_map = self._preprocess_source_neighbours()
+        # The neighbours maps and the CSR adjacency are built on first use, a path enumeration only needs the latter
+        self._target_neighbours_map = None
+        self._source_neighbours_map = None
+        self._adjacency = None
+        self._reverse_adjacency = None
+        # Cache of the find_paths results, keyed by the arguments and the version of the database
+        self._paths_cache = {}
+        self._version = 0
+
+    @property
+    def target_neighbours_map(self) -> dict:
+        """
+        The map from each node to the set of its target neighbours, built (once) on first use.
+        """
+        if self._target_neighbours_map is None:
+            self._target_neighbours_map = self._preprocess_target_neighbours()
+        return self._target_neighbours_map
+
+    @property
+    def source_neighbours_map(self) -> dict:
+        """
+        The map from each node to the set of its source neighbours, built (once) on first use.
+        """
+        if self._source_neighbours_map is None:
+            self._source_neighbours_map = self._preprocess_source_neighbours()
+        return self._source_neighbours_map
 
     def _preprocess_target_neighbours(self) -> dict:
         """
@@ -30,6 +345,63 @@ class Connections:
         df_targets = self.resources.set_index('target')
         return df_targets.groupby('target')['source'].apply(set).to_dict()
 
+    def _build_adjacency(self) -> Tuple[np.ndarray, np.ndarray, dict, np.ndarray]:
+        """
+        Build (once) the CSR adjacency of the database, with the nodes encoded as integers.
+
+        Returns:
+            The CSR (indptr, indices) arrays, the node to index map and the array of node names.
+        """
+        if self._adjacency is None:
+            n_edges = len(self.resources)
+            codes, names = pd.factorize(np.concatenate([self.resources['source'].to_numpy(),
+                                                        self.resources['target'].to_numpy()]))
+            names = np.asarray(names, dtype=object)
+            n = len(names)
+            mat = csr_matrix((np.ones(n_edges, dtype=np.int8), (codes[:n_edges], codes[n_edges:])), shape=(n, n))
+            mat.sum_duplicates()
+            node_index = {name: i for i, name in enumerate(names)}
+            self._adjacency = (mat.indptr.astype(np.int32), mat.indices.astype(np.int32), node_index, names)
+        return self._adjacency
+
+    def _build_reverse_adjacency(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build (once) the CSR arrays of the transposed adjacency, used to walk the database from target to source.
+
+        Returns:
+            The CSR (indptr, indices) arrays of the transposed adjacency.
+        """
+        if self._reverse_adjacency is None:
+            indptr, indices, _, names = self._build_adjacency()
+            n = len(names)
+            mat = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n)).T.tocsr()
+            mat.sort_indices()
+            self._reverse_adjacency = (mat.indptr.astype(np.int32), mat.indices.astype(np.int32))
+        return self._reverse_adjacency
+
+    def add_edges(self, edges: pd.DataFrame) -> None:
+        """
+        Add new interactions to the database, updating the neighbours maps already built in place instead of
+        rebuilding them from the whole database. The CSR adjacency and the cached paths are dropped and rebuilt
+        lazily on the next path search.
+
+        Args:
+            edges: A DataFrame with at least the columns 'source' and 'target' of the new interactions.
+        """
+        if edges.empty:
+            return
+        self.resources = pd.concat([self.resources, edges], ignore_index=True)
+        # The maps not built yet will be built from the updated database
+        for source, target in zip(edges['source'], edges['target']):
+            if self._target_neighbours_map is not None:
+                self._target_neighbours_map.setdefault(source, set()).add(target)
+            if self._source_neighbours_map is not None:
+                self._source_neighbours_map.setdefault(target, set()).add(source)
+        self._adjacency = None
+        self._reverse_adjacency = None
+        self._paths_cache.clear()
+        self._version += 1
+
     def find_target_neighbours(self, node: str) -> List[str]:
         """
         Optimized helper function that finds the neighbors of the target node.
@@ -77,6 +449,25 @@ class Connections:
 
         return []
 
+    def reachable(self, start: str) -> set:
+        """
+        Find all the nodes that can be reached from a node, with a single breadth first traversal of the CSR
+        adjacency. Useful to check at once if a node is connected to many others.
+
+        Args:
+            start: The start node.
+
+        Returns:
+            The set of nodes reachable from start, start included.
+        """
+        indptr, indices, node_index, names = self._build_adjacency()
+        if start not in node_index:
+            return {start}
+        n = len(names)
+        mat = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n, n))
+        order = breadth_first_order(mat, node_index[start], directed=True, return_predecessors=False)
+        return set(names[order])
+
     def find_paths(self,
                    start: Union[str, pd.DataFrame, List[str]],
                    end: Union[str, pd.DataFrame, List[str], None] = None,
@@ -84,18 +475,38 @@ class Connections:
                    minlen: int = 1,
                    loops: bool = False) -> List[Tuple[str, ...]]:
         """
-        Find paths or motifs in a network.
+        Find paths or motifs in a network. The results for a single start and end node are cached until the
+        database changes.
         """
+        cacheable = isinstance(start, str) and (end is None or isinstance(end, str))
+        if cacheable:
+            key = (start, end, maxlen, minlen, loops, self._version)
+            if key in self._paths_cache:
+                return list(self._paths_cache[key])
+
+        if cacheable and end is not None and not loops:
+            # The simple paths between two nodes are enumerated over the integer CSR adjacency of the database
+            all_paths = self.enumerate_paths(start, end, maxlen=maxlen, minlen=minlen)
+        else:
+            all_paths = self._find_paths_recursive(start, end, maxlen=maxlen, minlen=minlen, loops=loops)
+
+        if cacheable:
+            if len(self._paths_cache) >= _PATHS_CACHE_SIZE:
+                self._paths_cache.clear()
+            self._paths_cache[key] = all_paths
+            return list(all_paths)
+        return all_paths
 
-        def convert_to_string_list(start):
-            if isinstance(start, str):
-                return [start]
-            elif isinstance(start, pd.DataFrame):
-                return start['name_of_node'].tolist()
-            elif isinstance(start, list) and all(isinstance(item, str) for item in start):
-                return start
-            else:
-                raise ValueError("Invalid type for 'start' variable")
+    def _find_paths_recursive(self,
+                              start: Union[str, pd.DataFrame, List[str]],
+                              end: Union[str, pd.DataFrame, List[str], None] = None,
+                              maxlen: int = 2,
+                              minlen: int = 1,
+                              loops: bool = False) -> List[Tuple[str, ...]]:
+        """
+        Find paths or motifs in a network with a recursive depth-first search over the neighbours map. It is used by
+        find_paths for the searches with many start or end nodes, without end node or with loops.
+        """
 
         def find_all_paths_aux(start, end, path, maxlen):
             path = path + [start]
@@ -117,8 +528,8 @@ class Connections:
 
             return paths
 
-        start_nodes = convert_to_string_list(start)
-        end_nodes = convert_to_string_list(end) if end else [None]
+        start_nodes = _to_node_list(start)
+        end_nodes = _to_node_list(end) if end else [None]
 
         minlen = max(1, minlen)
         all_paths = []
@@ -129,6 +540,123 @@ class Connections:
 
         return all_paths
 
+    def enumerate_paths(self, start: str, end: str, maxlen: int = 2, minlen: int = 1) -> List[List[str]]:
+        """
+        Find all the simple paths between two nodes, with a length between minlen and maxlen, using the CSR
+        adjacency of the database. It returns the same paths as find_paths for a single start and end node.
+
+        Args:
+            start: The start node.
+            end: The end node.
+            maxlen: The maximum length of the paths.
+            minlen: The minimum length of the paths.
+
+        Returns:
+            List of paths, each path being a list of nodes.
+        """
+        indptr, indices, node_index, names = self._build_adjacency()
+        if start not in node_index or end not in node_index:
+            return []
+        if _enumerate_paths_jit is not None:
+            flat, offsets = _enumerate_paths_jit(indptr, indices, node_index[start], node_index[end], maxlen,
+                                                 max(1, minlen))
+            return [names[flat[i:j]].tolist() for i, j in zip(offsets[:-1], offsets[1:])]
+        paths = _enumerate_paths(indptr, indices, node_index[start], node_index[end], maxlen, max(1, minlen))
+        return [names[path].tolist() for path in paths]
+
+    def iter_paths(self,
+                   start: Union[str, pd.DataFrame, List[str]],
+                   end: Union[str, pd.DataFrame, List[str]],
+                   maxlen: int = 2,
+                   minlen: int = 1,
+                   n_jobs: int = 1) -> Iterator[List[str]]:
+        """
+        Generate lazily all the simple paths from the start nodes to the end nodes, with a length between minlen and
+        maxlen, over the CSR adjacency of the database. The paths are the same returned by find_paths, but they are
+        yielded start node by start node, without building the list of all the paths. The paths of a start node to
+        all the end nodes are found with a single traversal (see find_paths_multi) and yielded in the order of the
+        end nodes.
+
+        Args:
+            start: The start node, or a list of start nodes.
+            end: The end node, or a list of end nodes.
+            maxlen: The maximum length of the paths.
+            minlen: The minimum length of the paths.
+            n_jobs: The number of threads enumerating the paths of different start nodes at the same time, -1 uses
+                all the available CPUs. The threads run in parallel only with the numba-compiled enumeration, which
+                releases the GIL; the paths of each start node are then built in memory before being yielded, in the
+                same order. Default is 1.
+
+        Yields:
+            The paths, each path being a list of nodes.
+        """
+        end_nodes = _to_node_list(end)
+        if n_jobs != 1:
+            start_nodes = _to_node_list(start)
+            max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for paths in executor.map(lambda s: [path for e in end_nodes
+                                                     for path in self.enumerate_paths(s, e, maxlen, minlen)],
+                                          start_nodes):
+                    yield from paths
+            return
+        for s in _to_node_list(start):
+            found = self.find_paths_multi(s, end_nodes, maxlen, minlen)
+            for e in end_nodes:
+                yield from found[e]
+
+    def find_paths_multi(self,
+                         start: str,
+                         targets: Union[str, pd.DataFrame, List[str]],
+                         maxlen: int = 2,
+                         minlen: int = 1) -> Dict[str, List[List[str]]]:
+        """
+        Find all the simple paths from a node to each node of a set of targets, with a length between minlen and
+        maxlen, with a single traversal of the CSR adjacency of the database. For each target, the paths are the same
+        returned by find_paths(start, target), but the database is explored once instead of once per target.
+
+        Args:
+            start: The start node.
+            targets: The target node, or a list of target nodes.
+            maxlen: The maximum length of the paths.
+            minlen: The minimum length of the paths.
+
+        Returns:
+            Dictionary mapping each target node to the list of the paths from the start node to it.
+        """
+        indptr, indices, node_index, names = self._build_adjacency()
+        found = {target: [] for target in _to_node_list(targets)}
+        if start not in node_index:
+            return found
+        is_target = np.zeros(len(names), dtype=bool)
+        is_target[[node_index[target] for target in found if target in node_index]] = True
+        for path in _iter_paths_multi(indptr, indices, node_index[start], is_target, maxlen, max(1, minlen)):
+            found[names[path[-1]]].append(names[path].tolist())
+        return found
+
+    def bidirectional_paths(self, start: str, end: str, maxlen: int = 2, minlen: int = 1) -> List[List[str]]:
+        """
+        Find all the simple paths between two nodes, with a length between minlen and maxlen, searching at the same
+        time forward from the start node and backward from the end node. It returns the same paths as
+        enumerate_paths, but explores far fewer partial paths for long searches.
+
+        Args:
+            start: The start node.
+            end: The end node.
+            maxlen: The maximum length of the paths.
+            minlen: The minimum length of the paths.
+
+        Returns:
+            List of paths, each path being a list of nodes.
+        """
+        indptr, indices, node_index, names = self._build_adjacency()
+        if start not in node_index or end not in node_index or start == end:
+            return []
+        indptr_t, indices_t = self._build_reverse_adjacency()
+        paths = _bidirectional_paths(indptr, indices, indptr_t, indices_t, node_index[start], node_index[end],
+                                     maxlen, max(1, minlen))
+        return [path for same_length in paths for path in names[same_length].tolist()]
+
     def find_upstream_cascades(self,
                                target_genes: List[str],
                                max_depth: int = 1,
@@ -1,15 +1,28 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
+from functools import cached_property, lru_cache
 from pypath.utils import mapping
-from itertools import combinations
+from itertools import chain, combinations
+import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from .._inputs.resources import Resources
 from .._methods.enrichment_methods import Connections
 from typing_extensions import Literal
-import copy
+import os
+from concurrent.futures import ProcessPoolExecutor
 from .._annotations.gene_ontology import Ontology
 
-import networkx as nx
+
+# Categorical dtype of the "Effect" column of the edges
+_EFFECT_DTYPE = pd.CategoricalDtype(categories=["stimulation", "inhibition", "bimodal", "form complex", "undefined"])
+
+# Maximum number of identifiers kept in each of the caches of the pypath mapping lookups
+_MAPPING_CACHE_SIZE = 200_000
+
+# Number of buffered edges after which add_edge writes the buffer to the edges DataFrame
+_EDGE_BUFFER_SIZE = 1024
 
 
 def is_connected(network) -> bool:
@@ -17,19 +30,27 @@ def is_connected(network) -> bool:
     This function checks if a network is connected. It takes a Network object as input and returns True if the network
     is connected, otherwise it returns False.
 
+    The graph is made of the nodes of the network and of the endpoints of its edges. Its (weakly) connected
+    components are counted on a sparse adjacency matrix with `scipy.sparse.csgraph.connected_components`, without
+    building a graph object.
+
     Args:
         - network: A Network object representing the network to be checked.
 
     Returns:
         - bool
     """
-    # Create a graph from the edges
-    g = nx.from_pandas_edgelist(network.edges, 'source', 'target')
-    # Add isolated nodes to the graph
-    all_nodes = set(network.nodes['Uniprot'])
-    g.add_nodes_from(all_nodes)
-    # Check if the graph is connected
-    return nx.is_connected(g)
+    edges = network.edges
+    n_edges = len(edges)
+    # Encode the endpoints of the edges and the isolated nodes as integers
+    codes, names = pd.factorize(np.concatenate([edges["source"].to_numpy(dtype=object),
+                                                edges["target"].to_numpy(dtype=object),
+                                                network.nodes["Uniprot"].to_numpy(dtype=object)]),
+                                use_na_sentinel=False)
+    n = len(names)
+    mat = csr_matrix((np.ones(n_edges, dtype=np.int8), (codes[:n_edges], codes[n_edges:2 * n_edges])), shape=(n, n))
+    n_comp, _ = connected_components(mat, directed=False)
+    return n_comp == 1
 
 
 def check_sign(interaction: pd.DataFrame, consensus: bool = False) -> str:
@@ -38,7 +59,7 @@ def check_sign(interaction: pd.DataFrame, consensus: bool = False) -> str:
     The attribute "consensus" checks for the consistency of the sign of the interaction among the references.
 
     Args:
-        - interaction: A pandas DataFrame or Series representing the interaction.
+        - interaction: A pandas DataFrame or Series, or a dictionary, representing the interaction.
         - consensus: A boolean indicating whether to check for consensus among references.
 
     Returns:
@@ -47,6 +68,9 @@ def check_sign(interaction: pd.DataFrame, consensus: bool = False) -> str:
     # Handle both DataFrame and Series input
     if isinstance(interaction, pd.DataFrame):
         interaction = interaction.iloc[0]
+    # Read the interaction once as a dictionary, whose lookups are much cheaper than the label lookups of a Series
+    if isinstance(interaction, pd.Series):
+        interaction = interaction.to_dict()
 
     if consensus:
         if interaction.get("consensus_inhibition") and interaction.get("consensus_stimulation"):
@@ -72,23 +96,72 @@ def check_sign(interaction: pd.DataFrame, consensus: bool = False) -> str:
             return "undefined"
 
 
+def check_sign_vectorized(interactions: pd.DataFrame, consensus: bool = False) -> pd.Series:
+    """
+    This function is the vectorized version of `check_sign`: it checks the sign of every interaction of a DataFrame in
+    the Omnipath format at once, with column-wise operations instead of a Python call per row. Missing values in the
+    sign columns are considered False.
+
+    Args:
+        - interactions: A pandas DataFrame representing the interactions.
+        - consensus: A boolean indicating whether to check for consensus among references.
+
+    Returns:
+        - A pandas Series, with the same index of the interactions, containing the sign of each interaction:
+          "stimulation", "inhibition", "bimodal", "form complex", or "undefined".
+    """
+
+    def flag(column: str, default: bool) -> np.ndarray:
+        if column in interactions.columns:
+            return interactions[column].to_numpy(dtype=bool, na_value=False)
+        return np.full(len(interactions), default)
+
+    if consensus:
+        stimulation = flag("consensus_stimulation", False)
+        inhibition = flag("consensus_inhibition", False)
+        conditions = [stimulation & inhibition, stimulation, inhibition]
+        choices = ["bimodal", "stimulation", "inhibition"]
+    else:
+        # As in check_sign, an interaction without stimulation and inhibition columns is considered bimodal
+        conditions = [flag("is_stimulation", True) & flag("is_inhibition", True),
+                      flag("is_stimulation", False),
+                      flag("is_inhibition", False),
+                      flag("form_complex", False)]
+        choices = ["bimodal", "stimulation", "inhibition", "form complex"]
+
+    signs = np.select(conditions, choices, default="undefined").astype(object)
+    return pd.Series(signs, index=interactions.index)
+
+
 def check_gene_list_format(gene_list: list[str]) -> bool:
     """
     This function checks the format of the gene list and returns True if the gene list is in Uniprot format,
-    False if the gene list is in genesymbol format.
+    False otherwise (genesymbols, or identifiers that cannot be translated). Each identifier is looked up once
+    through the cached pypath mapping, and the check stops at the first identifier that is not in Uniprot format.
 
     Args:
         - gene_list: A list of gene identifiers. The gene identifiers can be either Uniprot identifiers or genesymbols.
 
     Returns:
-        - A boolean indicating whether the gene list is in Uniprot format (True) or genesymbol format (False).
+        - A boolean indicating whether the gene list is in Uniprot format (True) or not (False).
+    """
+    return all(_id_from_label0(gene) for gene in gene_list)
+
+
+@lru_cache(maxsize=_MAPPING_CACHE_SIZE)
+def _id_from_label0(gene: str):
+    """
+    Cached `mapping.id_from_label0` lookup of a single gene identifier.
+    """
+    return mapping.id_from_label0(gene)
+
+
+@lru_cache(maxsize=_MAPPING_CACHE_SIZE)
+def _label(gene: str):
     """
-    # Check if the gene list contains Uniprot identifiers
-    if all(mapping.id_from_label0(gene) for gene in gene_list):
-        return True
-    # Check if the gene list contains genesymbols
-    elif all(mapping.label(gene) for gene in gene_list):
-        return False
+    Cached `mapping.label` lookup of a single gene identifier.
+    """
+    return mapping.label(gene)
 
 
 def mapping_node_identifier(node: str) -> list[str]:
@@ -106,35 +179,59 @@ def mapping_node_identifier(node: str) -> list[str]:
         - A list containing the complex string, genesymbol, and uniprot identifier for the node. If the node identifier
           cannot be translated into one of these formats, the corresponding value in the list is None.
     """
+    return list(_mapping_node_identifier(node))
+
+
+@lru_cache(maxsize=_MAPPING_CACHE_SIZE)
+def _mapping_node_identifier(node: str) -> tuple:
+    """
+    Cached implementation of `mapping_node_identifier`, returning a (hashable) tuple. Each identifier is translated
+    through the pypath mapping tables only once per process, and the underlying lookups are shared with
+    `check_gene_list_format`, see `clear_mapping_cache`.
+    """
     complex_string = None
     genesymbol = None
     uniprot = None
 
-    if mapping.id_from_label0(node):
+    uid = _id_from_label0(node)
+    if uid:
         # Convert UniProt ID to gene symbol
-        uniprot = mapping.id_from_label0(node)
+        uniprot = uid
 
         # Set the UniProt ID as the 'Uniprot' value in the new entry
-        genesymbol = mapping.label(uniprot)
-    elif mapping.id_from_label0(node).startswith("COMPLEX"):
+        genesymbol = _label(uniprot)
+    elif node.startswith("COMPLEX"):
         node = node[8:]
         node_list = node.split("_")
 
-        # Translate each element in node_list using mapping.label
-        translated_node_list = [mapping.label(mapping.id_from_label0(item)) for item in node_list]
+        # Translate each element in node_list using the cached mapping.label lookup
+        translated_node_list = [_label(_id_from_label0(item)) for item in node_list]
 
         # Join the elements in node_list with "_"
         joined_node_string = "_".join(translated_node_list)
 
         # Add back the "COMPLEX:" prefix to the string
         complex_string = "COMPLEX:" + joined_node_string
-    elif mapping.label(node):
-        genesymbol = mapping.label(node)
-        uniprot = mapping.id_from_label0(genesymbol)
+    elif _label(node):
+        genesymbol = _label(node)
+        uniprot = _id_from_label0(genesymbol)
     else:
         print("Error during translation, check syntax for ", node)
 
-    return [complex_string, genesymbol, uniprot]
+    return complex_string, genesymbol, uniprot
+
+
+def clear_mapping_cache() -> None:
+    """
+    This function clears the cached identifier translations. It should be called if the pypath mapping tables are
+    reloaded.
+
+    Returns:
+        - None
+    """
+    _mapping_node_identifier.cache_clear()
+    _id_from_label0.cache_clear()
+    _label.cache_clear()
 
 
 def translate_paths(paths) -> list[list[str]]:
@@ -150,10 +247,12 @@ def translate_paths(paths) -> list[list[str]]:
         - A list of translated paths, where each path is a sequence of translated node identifiers.
     """
     translated_list = []
+    # Translation of each distinct node identifier of the paths
+    translated_nodes = {}
 
     def handle_complex_identifier(item):
         """
-        This helper function translates a node identifier using the `mapping_node_identifier` function.
+        This helper function translates a node identifier using the cached `mapping_node_identifier` lookup.
         It checks all possible identifiers (complex, genesymbol, uniprot) and returns the first non-None value.
 
         Args:
@@ -162,8 +261,10 @@ def translate_paths(paths) -> list[list[str]]:
         Returns:
         - The translated node identifier.
         """
-        identifiers = mapping_node_identifier(item)
-        return identifiers[0] or identifiers[1] or identifiers[2]
+        if item not in translated_nodes:
+            complex_string, genesymbol, uniprot = _mapping_node_identifier(item)
+            translated_nodes[item] = complex_string or genesymbol or uniprot
+        return translated_nodes[item]
 
     # If input_list is a list of strings
     if isinstance(paths[0], str):
@@ -184,13 +285,173 @@ def join_unique(series) -> str:
     Args:
         - series: A pandas Series object.
 
-    Returns: - A string of unique values in the series, joined by a comma. If a value in the series is None,
-                it is not included in the output string.
+    Returns: - A string of unique values in the series, in order of first appearance, joined by a comma. If a value
+                in the series is None, it is not included in the output string.
     """
-    # Filter out None values before converting to set and joining
-    filtered_series = [str(item) for item in series if item is not None]
-    unique_items = set(filtered_series)
-    return ', '.join(unique_items)
+    return ', '.join(pd.unique(series.dropna().astype(str)))
+
+
+def _build_sign_index(interactions: pd.DataFrame, consensus: bool) -> dict:
+    """
+    This function builds a dictionary with the sign of the interactions of the resources database, indexed by
+    (source, target). As in `check_sign`, the first interaction of each pair of nodes determines the sign.
+
+    Args:
+        - interactions: A pandas DataFrame with the interactions of the resources database.
+        - consensus: A boolean indicating whether to check for consensus among references.
+
+    Returns:
+        - A dictionary mapping each (source, target) pair to the sign of the interaction.
+    """
+    interactions = interactions.drop_duplicates(subset=["source", "target"])
+    signs = check_sign_vectorized(interactions, consensus)
+    return dict(zip(zip(interactions["source"], interactions["target"]), signs))
+
+
+def _iter_signed_paths(paths: Iterable, sign_index: dict) -> Iterator:
+    """
+    This function filters lazily the unsigned paths out of an iterable of paths. An unsigned path is a path where at
+    least one interaction of the resources database does not have a defined sign (stimulation or inhibition).
+
+    Args:
+        - paths: An iterable of paths, where each path is a sequence of nodes.
+        - sign_index: A dictionary mapping each (source, target) pair to the sign of the interaction, see
+                    `_build_sign_index`.
+
+    Returns:
+        - An iterator over the paths where all interactions are signed.
+    """
+    for path in paths:
+        # Stop at the first unsigned interaction, the rest of the path does not need to be checked
+        for step in zip(path, path[1:]):
+            if sign_index.get(step) == "undefined":
+                break
+        else:
+            yield path
+
+
+def _filter_unsigned_paths(paths: Iterable, sign_index: dict) -> list:
+    """
+    This function returns the list of the signed paths, see `_iter_signed_paths`.
+    """
+    return list(_iter_signed_paths(paths, sign_index))
+
+
+def _shortest_paths_multi(connections: Connections,
+                          sign_index: dict,
+                          node1: str,
+                          nodes2: list,
+                          maxlen: int,
+                          only_signed: bool) -> dict:
+    """
+    This function searches the shortest paths from node1 to each node of nodes2, with a single traversal of the
+    resources database (see `Connections.find_paths_multi`). For each node, the paths are the same found by
+    `_dfs_paths`: the (signed) paths of the smallest length up to maxlen.
+
+    Args:
+        - connections: A Connections object built from the resources database.
+        - sign_index: A dictionary mapping each (source, target) pair to the sign of the interaction.
+        - node1: The Uniprot identifier of the start node.
+        - nodes2: The Uniprot identifiers of the end nodes.
+        - maxlen: The maximum length of the paths.
+        - only_signed: A boolean flag indicating whether to filter unsigned paths.
+
+    Returns:
+        - A dictionary mapping each node of nodes2 to the list of the paths found, or to an empty list.
+    """
+    shortest = {}
+    for node2, paths in connections.find_paths_multi(node1, nodes2, maxlen=maxlen).items():
+        if only_signed:
+            paths = _filter_unsigned_paths(paths, sign_index)
+        length = min(map(len, paths), default=0)
+        shortest[node2] = [path for path in paths if len(path) == length]
+    return shortest
+
+
+def _dfs_paths(connections: Connections,
+               sign_index: dict,
+               node1: str,
+               node2: str,
+               maxlen: int,
+               only_signed: bool) -> list:
+    """
+    This function searches the shortest paths from node1 to node2, increasing the length of the paths until paths
+    are found or the maximum length is reached. It is the search step of `dfs_algorithm`.
+
+    Returns:
+        - The list of the paths found, or an empty list.
+    """
+    i = 1
+    min_len = 1
+    while i <= maxlen:
+        paths = connections.find_paths(start=node1, end=node2, maxlen=i, minlen=min_len)
+        if only_signed:
+            paths = _filter_unsigned_paths(paths, sign_index)
+        if paths:
+            return paths
+        i += 1
+        min_len += 1
+    return []
+
+
+def _bfs_paths(connections: Connections,
+               sign_index: dict,
+               node1: str,
+               node2: str,
+               maxlen: int,
+               only_signed: bool) -> list:
+    """
+    This function searches the shortest paths from node1 to node2 with a breadth-first search. It is the search step
+    of `bfs_algorithm`; maxlen is accepted for symmetry with `_dfs_paths` and is not used.
+
+    Returns:
+        - The list of the paths found, or an empty list.
+    """
+    paths = connections.bfs(start=node1, end=node2)
+    if only_signed:
+        paths = _filter_unsigned_paths(paths, sign_index)
+    return paths
+
+
+def merge_edges(edges: pd.DataFrame) -> pd.DataFrame:
+    """
+    This function merges the edges with the same source and target into a single edge, whose 'Type', 'Effect' and
+    'References' are the unique values of the merged edges joined by a comma (see `join_unique`). The values are
+    collected in a single pass over the edges, instead of calling `join_unique` on each group.
+
+    Args:
+        - edges: A pandas DataFrame with the columns 'source', 'target', 'Type', 'Effect' and 'References'.
+
+    Returns:
+        - A pandas DataFrame with one edge for each pair of source and target, sorted by source and target.
+    """
+    columns = ["Type", "Effect", "References"]
+    merged = {}
+    for source, target, *values in zip(edges["source"], edges["target"], *(edges[column] for column in columns)):
+        if pd.isna(source) or pd.isna(target):
+            continue
+        seen = merged.setdefault((source, target), tuple({} for _ in columns))
+        for unique_values, value in zip(seen, values):
+            if not pd.isna(value):
+                unique_values.setdefault(str(value), None)
+
+    rows = [(source, target, *(", ".join(unique_values) for unique_values in seen))
+            for (source, target), seen in sorted(merged.items())]
+    return pd.DataFrame(rows, columns=["source", "target"] + columns)
+
+
+# State of the worker processes of the parallel path searches, set once per process by _init_path_worker
+_path_worker_state = {}
+
+
+def _init_path_worker(connections: Connections, sign_index: dict) -> None:
+    _path_worker_state["connections"] = connections
+    _path_worker_state["sign_index"] = sign_index
+
+
+def _run_path_search(task: tuple) -> list:
+    search, args = task
+    return search(_path_worker_state["connections"], _path_worker_state["sign_index"], *args)
 
 
 class Network:
@@ -215,7 +476,10 @@ class Network:
                  sif_file=None,
                  resources=None):
         self.nodes = pd.DataFrame(columns=["Genesymbol", "Uniprot", "Type"])
-        self.edges = pd.DataFrame(columns=["source", "target", "Type", "Effect", "References"])
+        self.edges = pd.DataFrame(columns=["source", "target", "Type", "Effect", "References"]).astype(
+            {"Effect": _EFFECT_DTYPE})
+        self._edge_buffer: dict[tuple, dict] = {}
+        self._edges_idx = None
         self.initial_nodes = initial_nodes
         self.__ontology = Ontology()
         if resources is not None and isinstance(resources, pd.DataFrame) and not resources.empty:
@@ -239,8 +503,191 @@ class Network:
             'bfs': self.bfs_algorithm
         }
 
+    @property
+    def nodes(self) -> pd.DataFrame:
+        """
+        The nodes DataFrame of the network. Assigning a new DataFrame clears the cached set of Uniprot identifiers.
+        """
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: pd.DataFrame) -> None:
+        self._nodes = nodes
+        self._clear_node_cache()
+
+    @property
+    def resources(self) -> pd.DataFrame:
+        """
+        The resources database of the network. Assigning a new DataFrame clears the cached sets of sources and
+        targets.
+        """
+        return self._resources
+
+    @resources.setter
+    def resources(self, resources: pd.DataFrame) -> None:
+        self._resources = resources
+        self.__dict__.pop("_resource_sources", None)
+        self.__dict__.pop("_resource_targets", None)
+        self.__dict__.pop("_resource_nodes", None)
+        self.__dict__.pop("_resource_node_index", None)
+        self.__dict__.pop("_resource_rows", None)
+        self.__dict__.pop("_resource_effects", None)
+        self._sign_indices = {}
+
+    @cached_property
+    def _resource_sources(self) -> frozenset:
+        return frozenset(self.resources["source"].unique())
+
+    @cached_property
+    def _resource_targets(self) -> frozenset:
+        return frozenset(self.resources["target"].unique())
+
+    @cached_property
+    def _resource_nodes(self) -> frozenset:
+        return self._resource_sources | self._resource_targets
+
+    @cached_property
+    def _resource_node_index(self) -> pd.Index:
+        # The same nodes as an Index, for the bulk membership tests done with a single `isin`
+        return pd.Index(pd.unique(np.concatenate([self.resources["source"].to_numpy(),
+                                                  self.resources["target"].to_numpy()])))
+
+    @cached_property
+    def _resource_rows(self) -> dict:
+        return self.resources.groupby(["source", "target"], sort=False).indices
+
+    @cached_property
+    def _resource_effects(self) -> pd.Categorical:
+        # The effect of every interaction of the resources database, computed once as the edges added from the
+        # database are rows of it, see `_add_resource_edges`
+        return pd.Categorical(check_sign_vectorized(self.resources), dtype=_EFFECT_DTYPE)
+
+    def _interaction_row(self, source: str, target: str) -> Optional[int]:
+        """
+        This method returns the position, in the resources database, of the first interaction from source to target,
+        with a hash lookup instead of a boolean mask over the whole database. As in `add_edge`, the first
+        interaction of a pair of nodes is the one added to the network.
+
+        Args:
+            - source: The source node of the interaction.
+            - target: The target node of the interaction.
+
+        Returns:
+            - The integer position of the interaction, or None if there is no interaction from source to target.
+        """
+        rows = self._resource_rows.get((source, target))
+        return None if rows is None else rows[0]
+
+    @cached_property
+    def _node_uniprots(self) -> frozenset:
+        return frozenset(self.nodes["Uniprot"].unique())
+
+    @cached_property
+    def _node_rows(self) -> set:
+        return set(zip(self.nodes["Genesymbol"], self.nodes["Uniprot"], self.nodes["Type"]))
+
+    @cached_property
+    def _edge_keys(self) -> set:
+        edges = self.edges
+        return set(zip(edges["source"], edges["target"], edges["Effect"]))
+
+    @cached_property
+    def _edge_rows(self) -> dict:
+        # The buffered edges follow the written ones, their rows are added when they are written by _flush_edges
+        edges = self._written_edges()
+        edge_rows = {}
+        for row, key in enumerate(zip(edges["source"], edges["target"], edges["Effect"])):
+            edge_rows.setdefault(key, row)
+        return edge_rows
+
+    def _clear_node_cache(self) -> None:
+        """
+        This method clears the cached sets of Uniprot identifiers and rows of the nodes. It must be called after the
+        nodes DataFrame is modified in place.
+        """
+        self.__dict__.pop("_node_uniprots", None)
+        self.__dict__.pop("_node_rows", None)
+
+    def _clear_edge_cache(self) -> None:
+        """
+        This method clears the cached set of (source, target, effect) keys of the edges and their row positions. It
+        must be called after the edges DataFrame is modified in place.
+        """
+        self.__dict__.pop("_edge_keys", None)
+        self.__dict__.pop("_edge_rows", None)
+
+    def _drop_duplicated_edges(self) -> None:
+        """
+        This method removes the edges with the same source, target and effect. The edges added with `add_edge` and
+        `add_edges` are checked against the set of keys of the edges, so the DataFrame is rebuilt only when the set
+        has fewer keys than the DataFrame has rows.
+        """
+        edges = self.edges
+        if len(self._edge_keys) != len(edges) or not edges.index.equals(pd.RangeIndex(len(edges))):
+            self.edges = edges.drop_duplicates(subset=["source", "target", "Effect"], ignore_index=True)
+
+    @property
+    def edges(self) -> pd.DataFrame:
+        """
+        The edges DataFrame of the network. If edges have been removed through the (source, target)-indexed view,
+        the DataFrame is rebuilt from the view the first time it is read, and the buffered edges are written to it.
+        """
+        self._written_edges()
+        if self._edge_buffer:
+            self._flush_edges()
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges: pd.DataFrame) -> None:
+        self._edges = edges
+        self._edges_idx = None
+        self._clear_edge_cache()
+
+    def _written_edges(self) -> pd.DataFrame:
+        """
+        This method returns the edges DataFrame without the buffered edges, rebuilding it from the (source,
+        target)-indexed view if edges have been removed through it.
+
+        Returns:
+            - A pandas DataFrame with the edges of the network written so far.
+        """
+        if self._edges_idx is not None:
+            self._edges = self._edges_idx.reset_index()
+            self._edges_idx = None
+        return self._edges
+
+    def _indexed_edges(self) -> pd.DataFrame:
+        """
+        This method returns a view of the edges indexed by (source, target), built lazily from the edges DataFrame.
+        Consecutive removals work on this view, and the edges DataFrame is rebuilt only when it is read again.
+
+        Returns:
+            - A pandas DataFrame with the edges of the network indexed by 'source' and 'target'.
+        """
+        if self._edges_idx is None:
+            self._edges_idx = self.edges.set_index(["source", "target"])
+        return self._edges_idx
+
     def copy(self):
-        new_instance = copy.deepcopy(self)
+        """
+        This function returns a copy of the network. The nodes, the edges and the initial nodes are copied, while the
+        resources database and the objects built from it are shared with the original network, since they are not
+        modified by the network methods. Use `copy.deepcopy` to also copy the resources.
+
+        Returns:
+            - A new Network object.
+        """
+        new_instance = type(self).__new__(type(self))
+        new_instance.__dict__.update(self.__dict__)
+        new_instance.nodes = self.nodes.copy()
+        new_instance.edges = self.edges.copy()
+        new_instance._edge_buffer = {key: dict(row) for key, row in self._edge_buffer.items()}
+        if self.initial_nodes is not None:
+            new_instance.initial_nodes = list(self.initial_nodes)
+        new_instance.__algorithms = {
+            'dfs': new_instance.dfs_algorithm,
+            'bfs': new_instance.bfs_algorithm
+        }
         return new_instance
 
     def check_nodes(self, nodes: list[str]) -> list[str]:
@@ -253,8 +700,7 @@ class Network:
         Returns:
             - A list[str] of node identifiers that are present in the resources database.
         """
-        return [node for node in nodes if
-                node in self.resources["source"].unique() or node in self.resources["target"].unique()]
+        return [node for node in nodes if node in self._resource_nodes]
 
     def check_node(self, node: str) -> bool:
         """
@@ -266,7 +712,7 @@ class Network:
         Returns:
             - A boolean indicating whether the node exists in the resources' database.
         """
-        return True if self.check_nodes([node]) else False
+        return node in self._resource_nodes
 
     def __drop_missing_nodes(self) -> None:
         """
@@ -274,20 +720,19 @@ class Network:
         name of the missing nodes.
 
         The function works as follows:
-        1. It first calls the `check_nodes` function to get a list of nodes that exist in the resources' database.
-        2. It then finds the nodes in the network that are not in this list, and removes them from the network.
-        3. If there are any missing nodes, it prints a warning with their names.
+        1. It finds the nodes in the network that are not in the set of nodes of the resources' database, checking
+           each node once, and removes them from the network.
+        2. If there are any missing nodes, it prints a warning with their names.
 
         This function does not return anything. It modifies the `nodes` attribute of the `Network` object in-place.
         """
-        # Get the list of nodes that exist in the resources database
-        existing_nodes = self.check_nodes(self.nodes["Uniprot"].tolist())
-
-        # Find the nodes in the network that are not in the list of existing nodes
-        missing_nodes = [node for node in self.nodes["Uniprot"].tolist() if node not in existing_nodes]
+        # Find the nodes in the network that are not in the resources database, with a single pass over the nodes
+        uniprots = self.nodes["Uniprot"].to_numpy()
+        present = pd.Index(uniprots).isin(self._resource_node_index)
+        missing_nodes = uniprots[~present].tolist()
 
         # Remove the missing nodes from the network
-        self.nodes = self.nodes[~self.nodes["Uniprot"].isin(missing_nodes)]
+        self.nodes = self.nodes[present]
 
         # Print a warning with the name of the missing nodes
         if missing_nodes:
@@ -321,12 +766,10 @@ class Network:
             if not complex_string and not genesymbol and not uniprot:
                 print("Error: node %s could not be automatically translated" % node)
                 new_entry = {"Genesymbol": node, "Uniprot": node, "Type": "NaN"}
-                self.nodes.loc[len(self.nodes)] = new_entry
-                self.nodes = self.nodes.drop_duplicates().reset_index(drop=True)
+                self._append_node(new_entry)
 
             new_entry = {"Genesymbol": genesymbol, "Uniprot": uniprot, "Type": "NaN"}
-            self.nodes.loc[len(self.nodes)] = new_entry
-            self.nodes = self.nodes.drop_duplicates().reset_index(drop=True)
+            self._append_node(new_entry)
             self.initial_nodes.append(new_entry["Genesymbol"])
             self.initial_nodes = list(set(self.initial_nodes))
             return
@@ -342,9 +785,45 @@ class Network:
             print("Error: node %s is not present in the resources database" % node)
             return
 
-        self.nodes.loc[len(self.nodes)] = new_entry
+        self._append_node(new_entry)
+        return
+
+    def _append_node(self, new_entry: dict) -> None:
+        """
+        This method appends a node entry to the nodes DataFrame, unless the same entry is already present. Duplicated
+        entries are detected with the cached set of node rows, without scanning the nodes DataFrame.
 
-        self.nodes = self.nodes.drop_duplicates().reset_index(drop=True)
+        Args:
+            - new_entry: A dictionary with the 'Genesymbol', 'Uniprot' and 'Type' of the node.
+
+        Returns:
+            - None
+        """
+        if (new_entry["Genesymbol"], new_entry["Uniprot"], new_entry["Type"]) in self._node_rows:
+            return
+        # The index can have gaps after the removal of nodes, so the row is not written at the label len(self.nodes),
+        # which could overwrite an existing node
+        self._append_nodes([new_entry])
+        return
+
+    def _append_nodes(self, new_entries: list[dict]) -> None:
+        """
+        This method appends a batch of node entries to the nodes DataFrame with a single concatenation, dropping the
+        duplicated entries once. It is the batched counterpart of `_append_node`.
+
+        Args:
+            - new_entries: A list of dictionaries with the 'Genesymbol', 'Uniprot' and 'Type' of the nodes.
+
+        Returns:
+            - None
+        """
+        if not new_entries:
+            return
+        new_nodes = pd.DataFrame(new_entries, columns=self.nodes.columns, dtype=object)
+        if self.nodes.empty:
+            self.nodes = new_nodes.drop_duplicates(ignore_index=True)
+        else:
+            self.nodes = pd.concat([self.nodes, new_nodes], ignore_index=True).drop_duplicates(ignore_index=True)
         return
 
     def remove_node(self, node: str) -> None:
@@ -364,12 +843,21 @@ class Network:
         # Translate the node identifier to Uniprot
         node = mapping_node_identifier(node)[2]
 
-        # Remove any edges associated with the node from the edges DataFrame
-        self.edges = self.edges[~self.edges[['source', 'target']].isin([node]).any(axis=1)]
+        # Remove any edges associated with the node from the (source, target)-indexed edges, comparing the integer
+        # codes of both index levels in a single mask
+        edges_idx = self._indexed_edges()
+        keep = np.ones(len(edges_idx), dtype=bool)
+        for level, codes in zip(edges_idx.index.levels, edges_idx.index.codes):
+            code = level.get_indexer([node])[0]
+            if code != -1:
+                keep &= codes != code
+        if not keep.all():
+            self._edges_idx = edges_idx[keep]
+        self._clear_edge_cache()
 
         return
 
-    def add_edge(self, edge: pd.DataFrame) -> None:
+    def add_edge(self, edge: pd.DataFrame, flush: bool = True) -> None:
         """
         This method adds an interaction to the list of interactions while converting it to the NeKo-network format.
         It checks if the edge represents inhibition or stimulation and sets the effect accordingly. It also checks if the
@@ -380,46 +868,234 @@ class Network:
             'source', 'target', 'type', and 'references'. The 'source' and 'target' columns represent the nodes involved
             in the interaction. The 'type' column represents the type of interaction. The 'references' column contains
             the references for the interaction.
+            - flush: A boolean flag indicating whether to write the buffered edges once the buffer is full, instead of
+            keeping them until `_flush_edges` is called or the edges are read. Default is True.
 
         Returns:
             - None
         """
 
+        # Read the first row of the edge once as a dictionary
+        row = edge.iloc[0].to_dict()
         # Check if the edge represents inhibition or stimulation and set the effect accordingly
-        effect = check_sign(edge)
-        references = edge["references"].values[0]
+        effect = check_sign(row)
+        source = row["source"]
+        target = row["target"]
+        references = row["references"]
         # Get the type value from the edge DataFrame or set it to None
-        edge_type = edge["type"].values[0] if "type" in edge.columns else None
+        edge_type = row.get("type")
 
-        # Create a new DataFrame with edge information, including handling None for type
-        df_edge = pd.DataFrame({
-            "source": edge["source"],
-            "target": edge["target"],
+        # Use the cached set of Uniprot identifiers for efficient membership test
+        uniprot_nodes = self._node_uniprots
+
+        # add the new nodes to the nodes dataframe
+        if source not in uniprot_nodes:
+            self.add_node(source)
+        if target not in uniprot_nodes:
+            self.add_node(target)
+
+        # Detect the edges with the same source, target and effect with the cached set of edge keys
+        key = (source, target, effect)
+        if key in self._edge_keys:
+            if key in self._edge_buffer:
+                # Merge the references with the ones of the buffered edge
+                self._edge_buffer[key]["References"] += "; " + str(references)
+            else:
+                # Merge the references with the ones of the edge already in the network, found by its row position,
+                # without writing the buffered edges
+                edges = self._written_edges()
+                row = self._edge_rows.get(key)
+                if row is not None:
+                    column = edges.columns.get_loc("References")
+                    edges.iat[row, column] = edges.iat[row, column] + "; " + str(references)
+            return
+
+        # Defer the edge, it will be written to the edges DataFrame by _flush_edges
+        self._edge_keys.add(key)
+        self._edge_buffer[key] = {
+            "source": source,
+            "target": target,
             "Type": edge_type,
             "Effect": effect,
             "References": references
-        })
+        }
+        if flush and len(self._edge_buffer) >= _EDGE_BUFFER_SIZE:
+            self._flush_edges()
+        return
+
+    def _edge_codes(self) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        This method encodes the source and target nodes of the edges as the integer position of the nodes in the
+        network, so that the edges can be processed as integer arrays.
+
+        Returns:
+            - The number of nodes of the network, and two int32 arrays with the codes of the source and target nodes
+              of each edge. The nodes that are not in the network are encoded as -1.
+        """
+        nodes = pd.Index(self.nodes["Uniprot"].dropna().unique())
+        sources = nodes.get_indexer(self.edges["source"]).astype(np.int32)
+        targets = nodes.get_indexer(self.edges["target"]).astype(np.int32)
+        return len(nodes), sources, targets
+
+    def _flush_edges(self) -> None:
+        """
+        This method writes the edges collected in the edge buffer (see `add_edge`) to the edges DataFrame, dropping
+        the edges with the same source, target and effect.
+
+        The buffered edges have keys that are not in the network, so when the edges DataFrame has no duplicated
+        keys either, each column is written once into an array sized for all the edges, keeping the dtype of the
+        column, and the DataFrame is built from these arrays without a concatenation followed by a search for
+        duplicates.
+
+        Returns:
+            - None
+        """
+        if not self._edge_buffer:
+            return
+        rows = list(self._edge_buffer.values())
+        self._edge_buffer = {}
+        edges = self.edges
+        n_edges = len(edges)
+        edge_keys = self.__dict__.get("_edge_keys")
+        if not n_edges or edge_keys is None or len(edge_keys) != n_edges + len(rows):
+            # Build the DataFrame column by column, without inferring the columns of each buffered row
+            df_edges = pd.DataFrame({column: [row[column] for row in rows] for column in edges.columns})
+            df_edges["Effect"] = df_edges["Effect"].astype(_EFFECT_DTYPE)
+            self._concat_edges(df_edges)
+            return
+        columns = {}
+        for column in edges.columns:
+            values = np.empty(n_edges + len(rows), dtype=object)
+            values[:n_edges] = edges[column].to_numpy(dtype=object)
+            values[n_edges:] = [row[column] for row in rows]
+            columns[column] = pd.Series(values, dtype=edges[column].dtype, copy=False)
+        edge_rows = self.__dict__.get("_edge_rows")
+        self.edges = pd.DataFrame(columns, copy=False)
+        # The keys of the buffered edges are already in the set, and the previous edges keep their positions
+        self.__dict__["_edge_keys"] = edge_keys
+        if edge_rows is not None and len(edge_rows) == n_edges:
+            edge_rows.update((key, row) for row, key in enumerate(
+                ((row["source"], row["target"], row["Effect"]) for row in rows), start=n_edges))
+            self.__dict__["_edge_rows"] = edge_rows
+        return
+
+    def _concat_edges(self, df_edges: pd.DataFrame) -> None:
+        """
+        This method concatenates a DataFrame of edges, already in the NeKo-network format, to the edges DataFrame,
+        dropping the edges with the same source, target and effect.
+
+        Args:
+            - df_edges: A pandas DataFrame with the columns 'source', 'target', 'Type', 'Effect' and 'References'.
+
+        Returns:
+            - None
+        """
+        edge_keys = self.__dict__.get("_edge_keys")
+        edge_rows = self.__dict__.get("_edge_rows")
+        n_edges = len(self.edges)
+        self.edges = pd.concat([self.edges, df_edges], ignore_index=True).drop_duplicates(
+            subset=["source", "target", "Effect"]).reset_index(drop=True)
+        # The dropped edges have a key already in the set, so the cached keys stay valid with the new ones
+        if edge_keys is not None:
+            edge_keys.update(zip(df_edges["source"], df_edges["target"], df_edges["Effect"]))
+            self.__dict__["_edge_keys"] = edge_keys
+        # If the previous edges had no duplicates, they keep their positions and the new edges follow them
+        if edge_rows is not None and len(edge_rows) == n_edges:
+            new_edges = self.edges.iloc[n_edges:]
+            edge_rows.update((key, row) for row, key in enumerate(
+                zip(new_edges["source"], new_edges["target"], new_edges["Effect"]), start=n_edges))
+            self.__dict__["_edge_rows"] = edge_rows
+        return
+
+    def add_edges(self, edges: pd.DataFrame) -> None:
+        """
+        This method adds a batch of interactions to the list of interactions at once, converting them to the
+        NeKo-network format with vectorized operations. It is the batched counterpart of `add_edge`: the effects are
+        computed for all the interactions together and the missing nodes are added to the network. As in `add_edge`,
+        the references of an interaction whose source, target and effect match an edge of the network, or a previous
+        interaction of the batch, are merged with the references of that edge.
 
-        # Convert the "Uniprot" column to a set for efficient membership test
-        uniprot_nodes = set(self.nodes["Uniprot"].unique())
+        Args:
+            - edges: A pandas DataFrame of interactions, with the same columns expected by `add_edge`.
+
+        Returns:
+            - None
+        """
+        if edges.empty:
+            return
+        self._add_edges(edges, pd.Categorical(check_sign_vectorized(edges), dtype=_EFFECT_DTYPE))
+        return
 
+    def _add_resource_edges(self, rows: list[int]) -> None:
+        """
+        This method adds the interactions at the given positions of the resources database to the list of
+        interactions, see `add_edges`. Their effects are taken from the effects of the database, computed once.
+
+        Args:
+            - rows: A list with the positions of the interactions in the resources database.
+
+        Returns:
+            - None
+        """
+        if not len(rows):
+            return
+        self._add_edges(self.resources.iloc[rows], self._resource_effects[rows])
+        return
+
+    def _add_edges(self, edges: pd.DataFrame, effects: pd.Categorical) -> None:
+        """
+        This method implements `add_edges` for interactions whose effects have already been computed.
+
+        Args:
+            - edges: A pandas DataFrame of interactions, with the same columns expected by `add_edge`.
+            - effects: A pandas Categorical with the effect of each interaction.
+
+        Returns:
+            - None
+        """
         # add the new nodes to the nodes dataframe
-        if edge["source"].values[0] not in uniprot_nodes:
-            self.add_node(edge["source"].values[0])
-        if edge["target"].values[0] not in uniprot_nodes:
-            self.add_node(edge["target"].values[0])
-
-        # if in the edge dataframe there is an edge with the same source, target and effect, merge the references
-        existing_edge = self.edges[(self.edges["source"] == edge["source"].values[0]) &
-                                   (self.edges["target"] == edge["target"].values[0]) &
-                                   (self.edges["Effect"] == effect)]
-        if not existing_edge.empty:
-            self.edges.loc[existing_edge.index, "References"] += "; " + str(references)
-        else:
-            # Concatenate the new edge DataFrame with the existing edges in the graph
-            self.edges = pd.concat([self.edges, df_edge])
+        uniprot_nodes = self._node_uniprots
+        for node in pd.unique(edges[["source", "target"]].to_numpy().ravel()):
+            if node not in uniprot_nodes:
+                self.add_node(node)
+
+        df_edges = pd.DataFrame({
+            "source": edges["source"].to_numpy(),
+            "target": edges["target"].to_numpy(),
+            "Type": edges["type"].to_numpy() if "type" in edges.columns else None,
+            "Effect": effects,
+            "References": edges["references"].to_numpy()
+        })
+
+        # Write the pending buffered edges first to keep the insertion order
+        self._flush_edges()
+
+        # As in add_edge, the references of an edge with the same source, target and effect of an edge already in
+        # the network, or of a previous edge of the batch, are merged with the references of that edge
+        edges = self.edges
+        edge_keys = self._edge_keys
+        keys = list(zip(df_edges["source"], df_edges["target"], df_edges["Effect"]))
+        references = df_edges["References"].tolist()
+        new_edges = np.ones(len(keys), dtype=bool)
+        first_rows = {}
+        for i, key in enumerate(keys):
+            if key in edge_keys:
+                new_edges[i] = False
+                row = self._edge_rows.get(key)
+                if row is not None:
+                    column = edges.columns.get_loc("References")
+                    edges.iat[row, column] = edges.iat[row, column] + "; " + str(references[i])
+            elif key in first_rows:
+                new_edges[i] = False
+                references[first_rows[key]] = references[first_rows[key]] + "; " + str(references[i])
+            else:
+                first_rows[key] = i
+        if not new_edges.all():
+            df_edges["References"] = references
+            df_edges = df_edges[new_edges]
 
-        self.edges = self.edges.drop_duplicates().reset_index(drop=True)
+        if not df_edges.empty:
+            self._concat_edges(df_edges)
         return
 
     def remove_edge(self, node1: str, node2: str) -> None:
@@ -441,8 +1117,10 @@ class Network:
             node2 = mapping_node_identifier(node2)[2]
 
         # Remove the edge from the edges DataFrame, if the effect or the nodes are not present, print a warning
-        if not self.edges[(self.edges["source"] == node1) & (self.edges["target"] == node2)].empty:
-            self.edges = self.edges[~((self.edges["source"] == node1) & (self.edges["target"] == node2))]
+        edges_idx = self._indexed_edges()
+        if (node1, node2) in edges_idx.index:
+            self._edges_idx = edges_idx.drop((node1, node2))
+            self._clear_edge_cache()
         else:
             print("Warning: The edge does not exist in the network, check syntax for ",
                   mapping_node_identifier(node1)[1], " and ", mapping_node_identifier(node2)[1])
@@ -455,13 +1133,65 @@ class Network:
         Returns:
         None. The function modifies the network object in-place by removing the disconnected nodes from the nodes DataFrame.
         """
-        # Get the list of nodes that are not connected to any other nodes
-        disconnected_nodes = self.nodes[~self.nodes["Uniprot"].isin(self.edges["source"]) &
-                                        ~self.nodes["Uniprot"].isin(self.edges["target"])]
+        # Keep the nodes that are the source or the target of at least one edge, with a single mask over the nodes
+        edges = self.edges
+        connected = self.nodes["Uniprot"].isin(edges["source"]) | self.nodes["Uniprot"].isin(edges["target"])
+        self.nodes = self.nodes[connected]
 
-        # Remove the disconnected nodes from the nodes DataFrame
-        self.nodes = self.nodes[~self.nodes["Uniprot"].isin(disconnected_nodes["Uniprot"])]
+        return
+
+    def _remove_dangling_nodes(self, kept_nodes: set) -> None:
+        """
+        This method removes, until none is left, the nodes that are not the source or not the target of any edge,
+        except the kept nodes, together with their edges. Removing a node can leave its neighbours without a source
+        or a target, so the nodes are peeled one at a time by updating the in- and out-degrees of the neighbours,
+        and the nodes and edges DataFrames are filtered once at the end.
+
+        Args:
+            - kept_nodes: A set with the Uniprot identifiers of the nodes that are never removed.
 
+        Returns:
+            - None
+        """
+        edges = self.edges
+        sources = edges["source"].tolist()
+        targets = edges["target"].tolist()
+        node_set = set(self.nodes["Uniprot"])
+
+        # In- and out-degree of each node and the positions of the edges of each node
+        in_degree = dict.fromkeys(node_set, 0)
+        out_degree = dict.fromkeys(node_set, 0)
+        node_edges = {}
+        for position, (source, target) in enumerate(zip(sources, targets)):
+            out_degree[source] = out_degree.get(source, 0) + 1
+            in_degree[target] = in_degree.get(target, 0) + 1
+            node_edges.setdefault(source, []).append(position)
+            if target != source:
+                node_edges.setdefault(target, []).append(position)
+
+        def dangling(node) -> bool:
+            return node in node_set and node not in kept_nodes and (not in_degree[node] or not out_degree[node])
+
+        kept_edges = np.ones(len(sources), dtype=bool)
+        removed = set()
+        stack = [node for node in node_set if dangling(node)]
+        while stack:
+            node = stack.pop()
+            if node in removed:
+                continue
+            removed.add(node)
+            for position in node_edges.get(node, []):
+                if kept_edges[position]:
+                    kept_edges[position] = False
+                    source, target = sources[position], targets[position]
+                    out_degree[source] -= 1
+                    in_degree[target] -= 1
+                    stack.extend(neighbour for neighbour in (source, target)
+                                 if neighbour not in removed and dangling(neighbour))
+
+        if removed:
+            self.nodes = self.nodes[~self.nodes["Uniprot"].isin(removed) & ~self.nodes["Genesymbol"].isin(removed)]
+            self.edges = edges[kept_edges].reset_index(drop=True)
         return
 
     def modify_node_name(self, old_name: str, new_name: str,
@@ -486,11 +1216,14 @@ class Network:
 
         if type == 'Genesymbol':
             self.nodes.loc[self.nodes["Genesymbol"] == old_name, "Genesymbol"] = new_name
+            self._clear_node_cache()
         elif type == 'Uniprot':
             self.nodes.loc[self.nodes["Uniprot"] == old_name, "Uniprot"] = new_name
+            self._clear_node_cache()
             # Update the source and target columns in the edges DataFrame
             self.edges.loc[self.edges["source"] == old_name, "source"] = new_name
             self.edges.loc[self.edges["target"] == old_name, "target"] = new_name
+            self._clear_edge_cache()
         elif type == 'both':
             self.nodes.loc[self.nodes["Genesymbol"] == old_name, "Genesymbol"] = new_name
             # check if it is possible to translate the genesymbol to uniprot
@@ -501,9 +1234,11 @@ class Network:
                 new_name_uniprot = new_name
                 old_name_uniprot = old_name
             self.nodes.loc[self.nodes["Uniprot"] == old_name_uniprot, "Uniprot"] = new_name_uniprot
+            self._clear_node_cache()
             # Update the source and target columns in the edges DataFrame
             self.edges.loc[self.edges["source"] == old_name_uniprot, "source"] = new_name_uniprot
             self.edges.loc[self.edges["target"] == old_name_uniprot, "target"] = new_name_uniprot
+            self._clear_edge_cache()
         else:
             print("Error: Invalid type. Please choose 'Genesymbol', 'Uniprot', or 'both'.")
 
@@ -516,8 +1251,9 @@ class Network:
                        genesymbol: bool = True
                        ) -> None:
         """
-        This function prints all the paths between two nodes in the network. It uses the `find_paths` method from the
-        `Connections` class to find all the paths between the two nodes in the Network object. If no paths are found,
+        This function prints all the paths between two nodes in the network. It uses the `enumerate_paths` method from
+        the `Connections` class (or `bidirectional_paths`, for searches of length 3 or more) to find all the paths
+        between the two nodes in the Network object. If no paths are found,
         it prints a warning message. If one of the selected nodes is not present in the network, it prints an error message.
 
         Args:
@@ -537,11 +1273,14 @@ class Network:
             node2 = mapping_node_identifier(node2)[2]
 
         # Check if the nodes exist in the network
-        if node1 not in self.nodes["Uniprot"].tolist() or node2 not in self.nodes["Uniprot"].tolist():
+        if node1 not in self._node_uniprots or node2 not in self._node_uniprots:
             print("Error: One or both of the selected nodes are not present in the network.")
             return
         connect = Connections(self.edges)
-        paths = connect.find_paths(node1, node2, maxlen=maxlen)
+        if maxlen >= 3:
+            paths = connect.bidirectional_paths(node1, node2, maxlen=maxlen)
+        else:
+            paths = connect.enumerate_paths(node1, node2, maxlen=maxlen)
 
         if not paths:
             print("Warning: No paths found between source: ", node1, " and target: ", node2)
@@ -567,15 +1306,22 @@ class Network:
         Returns:
             - None
         """
-        # check if node1 and node2 are in genesymbol format or uniprot format
-        if check_gene_list_format(path):
-            path = [mapping_node_identifier(node)[2] for node in path]
-
-        # Iterate through the nodes in the path and remove the edges between them
-        for i in range(0, len(path)):
-            if i == len(path) - 1:
-                break
-            self.remove_edge(path[i], path[i + 1])
+        # Translate each node as remove_edge does
+        path = [mapping_node_identifier(node)[2] if check_gene_list_format([node]) else node for node in path]
+
+        # Collect the edges between consecutive nodes of the path and remove them all at once from the
+        # (source, target)-indexed edges, printing a warning for the edges that do not exist
+        edges_idx = self._indexed_edges()
+        removed = []
+        for node1, node2 in zip(path[:-1], path[1:]):
+            if (node1, node2) in edges_idx.index and (node1, node2) not in removed:
+                removed.append((node1, node2))
+            else:
+                print("Warning: The edge does not exist in the network, check syntax for ",
+                      mapping_node_identifier(node1)[1], " and ", mapping_node_identifier(node2)[1])
+        if removed:
+            self._edges_idx = edges_idx.drop(removed)
+            self._clear_edge_cache()
         return
 
     def __load_network_from_sif(self, sif_file) -> None:
@@ -588,68 +1334,65 @@ class Network:
         Returns:
             None
         """
-        interactions = []
-        node_set = set()
-
-        def determine_effect(interaction_type):
-            """
-            Determine the effect based on the interaction type.
-
-            Args:
-            - interaction_type: A string representing the type of interaction.
-
-            Returns:
-            - A string representing the effect of the interaction. If the interaction type is not recognized, it returns "undefined".
-            """
-            effect_types = {
-                "1": "stimulation",
-                "activate": "stimulation",
-                "stimulate": "stimulation",
-                "phosphorilate": "undefined",
-                "stimulation": "stimulation",
-                "->": "stimulation",
-                "-|": "inhibition",
-                "-1": "inhibition",
-                "inhibit": "inhibition",
-                "block": "inhibition",
-                "inhibition": "inhibition",
-                "form_complex": "form complex",
-                "form-complex": "form complex",
-                "complex_formation": "form complex",
-                "bimodal": "bimodal",
-                "both": "bimodal"
-            }
-            return effect_types.get(interaction_type, "undefined")
+        # Map each interaction type of the SIF format to the corresponding effect
+        effect_types = {
+            "1": "stimulation",
+            "activate": "stimulation",
+            "stimulate": "stimulation",
+            "phosphorilate": "undefined",
+            "stimulation": "stimulation",
+            "->": "stimulation",
+            "-|": "inhibition",
+            "-1": "inhibition",
+            "inhibit": "inhibition",
+            "block": "inhibition",
+            "inhibition": "inhibition",
+            "form_complex": "form complex",
+            "form-complex": "form complex",
+            "complex_formation": "form complex",
+            "bimodal": "bimodal",
+            "both": "bimodal"
+        }
 
+        # Split the lines of the file, skipping comment lines, malformed lines and the columns after the fourth one.
+        # The fourth column (Type) is optional, so the lines are padded to four columns when building the DataFrame
         with open(sif_file, "r") as f:
-            for line in f:
-                if line.startswith('#'):  # Skip comment lines
-                    continue
-                interaction = line.strip().split()
-                if len(interaction) < 3:
-                    continue  # Skip malformed lines
-
-                effect = determine_effect(interaction[1])
-
-                interactions.append({
-                    "source": mapping_node_identifier(interaction[0])[2] if check_gene_list_format(
-                        [interaction[0]]) else interaction[0],
-                    "target": mapping_node_identifier(interaction[2])[2] if check_gene_list_format(
-                        [interaction[2]]) else interaction[2],
-                    "Type": interaction[3] if len(interaction) > 3 else None,
-                    "Effect": effect,
-                    "References": "SIF file"
-                })
-                node_set.update([interaction[0], interaction[2]])
+            lines = [fields[:4] for fields in (line.split() for line in f if not line.startswith("#"))
+                     if len(fields) >= 3]
+        sif = pd.DataFrame(lines, dtype=object).reindex(columns=range(4))
+        sif.columns = ["source", "interaction", "target", "Type"]
+
+        # Determine the effect based on the interaction type. If the interaction type is not recognized,
+        # the effect is "undefined"
+        effects = sif["interaction"].map(effect_types).fillna("undefined")
+
+        # Translate each distinct node identifier only once, in order of first appearance in the file
+        node_set = pd.unique(sif[["source", "target"]].to_numpy().ravel())
+        translation = {node: _mapping_node_identifier(node)[2] if check_gene_list_format([node]) else node
+                       for node in node_set}
 
         # Create or update the edges DataFrame
-        df_edge = pd.DataFrame(interactions)
+        df_edge = pd.DataFrame({
+            "source": sif["source"].map(translation),
+            "target": sif["target"].map(translation),
+            "Type": sif["Type"].astype(object).where(sif["Type"].notna(), None).tolist(),
+            "Effect": effects.astype(_EFFECT_DTYPE),
+            "References": "SIF file"
+        })
         self.edges = pd.concat([self.edges, df_edge], ignore_index=True)
 
-        # Update the nodes list
-        nodes = list(node_set)
-        for node in nodes:
-            self.add_node(node, from_sif=True)
+        # Update the nodes list, building the entries of all the nodes and appending them at once. As in add_node
+        # with from_sif, a node that cannot be translated is added with its own identifier
+        new_entries = []
+        for node in node_set:
+            complex_string, genesymbol, uniprot = _mapping_node_identifier(node)
+            if not complex_string and not genesymbol and not uniprot:
+                print("Error: node %s could not be automatically translated" % node)
+                new_entries.append({"Genesymbol": node, "Uniprot": node, "Type": "NaN"})
+            new_entries.append({"Genesymbol": genesymbol, "Uniprot": uniprot, "Type": "NaN"})
+            self.initial_nodes.append(genesymbol)
+        self.initial_nodes = list(set(self.initial_nodes))
+        self._append_nodes(new_entries)
 
         return
 
@@ -661,13 +1404,15 @@ class Network:
         the network.
 
         Args:
-            - paths: A list of paths, where each path is a sequence of nodes. A node can be a string or a tuple.
+            - paths: An iterable of paths, where each path is a sequence of nodes. A node can be a string or a tuple.
 
         Returns:
             - None
         """
-        # Access the resources database
-        database = self.resources
+        # Keep track of the (source, target) pairs of the network, including the edges found in the paths
+        added_edges = set(zip(self.edges["source"], self.edges["target"]))
+        # Positions in the resources database of the interactions to add
+        rows = []
 
         # Iterate through the list of paths
         for path in paths:
@@ -682,21 +1427,19 @@ class Network:
                     break
 
                 # Check if there is an interaction between the current node and the next node in the resources database
-                interaction = database.loc[(database["source"] == path[i]) &
-                                           (database["target"] == path[i + 1])]
+                row = self._interaction_row(path[i], path[i + 1])
 
-                # If an interaction exists, add it to the edge list of the network
-                if not interaction.empty:
-                    if not ((self.edges['source'] == interaction['source'].values[0]) &
-                            (self.edges['target'] == interaction['target'].values[0])).any():
-                        self.add_edge(interaction)
+                # If an interaction exists, collect it for the edge list of the network
+                if row is not None and (path[i], path[i + 1]) not in added_edges:
+                    rows.append(row)
+                    added_edges.add((path[i], path[i + 1]))
 
-        # Remove duplicate edges from the edge list
-        self.edges = self.edges.drop_duplicates().reset_index(drop=True)
+        # Add the new edges to the edge list at once with the effects computed for the database, removing duplicates
+        self._add_resource_edges(rows)
 
         return
 
-    def __add_cascade_to_edge_list(self, cascades) -> None:
+    def __add_cascade_to_edge_list(self, cascades, verbose: bool = False) -> None:
         """
         This function adds cascades to the edge list of the network. A cascade is a sequence of nodes where each node is
         connected to the next node in the sequence. The function checks if there is an interaction between each pair of nodes
@@ -704,20 +1447,21 @@ class Network:
 
         Args:
             - cascades: A list of cascades, where each cascade is a sequence of nodes.
+            - verbose: A boolean flag indicating whether to print the cascades without interaction. Default is False.
 
         Returns:
             - None
         """
-        database = self.resources
-
+        rows = []
         for cascade in cascades:
-            interaction_in = database.loc[(database["source"] == cascade[0]) &
-                                          (database["target"] == cascade[1])]
-            if interaction_in.empty:
-                print("Empty interaction for node ", cascade[0], " and ", cascade[1])
+            row = self._interaction_row(cascade[0], cascade[1])
+            if row is None:
+                if verbose:
+                    print("Empty interaction for node ", cascade[0], " and ", cascade[1])
             else:
-                self.add_edge(interaction_in)
-        self.edges = self.edges.drop_duplicates().reset_index(drop=True)
+                rows.append(row)
+        # Add the interactions of all the cascades at once, see add_edges
+        self._add_resource_edges(rows)
 
         return
 
@@ -744,58 +1488,120 @@ class Network:
             print("Number of node insufficient to create connection")
             return
 
-        def add_edge_if_not_empty_and_signed(node1, node2):
-            """
-            Helper function to add an edge to the network if the interaction is not empty and, if the `only_signed`
-            flag is set, the interaction is signed.
-
-            Args:
-            - node1: The source node of the interaction.
-            - node2: The target node of the interaction.
-
-            Returns:
-            None. The function modifies the network object in-place.
-            """
-            if node2 in self.__connect.find_all_neighbours(node1):
-                interaction = self.resources.loc[(self.resources["source"] == node1) &
-                                                 (self.resources["target"] == node2)]
-                if not interaction.empty and (
-                    not only_signed or check_sign(interaction, consensus_only) != "undefined"):
-                    self.add_edge(interaction)
-
-        for node1, node2 in combinations(self.nodes["Uniprot"], 2):
-            add_edge_if_not_empty_and_signed(node1, node2)
-            add_edge_if_not_empty_and_signed(node2, node1)
+        # Select at once all the interactions of the resources database between two different nodes of the network
+        uniprot_nodes = set(self.nodes["Uniprot"])
+        mask = (self.resources["source"].isin(uniprot_nodes) &
+                self.resources["target"].isin(uniprot_nodes) &
+                (self.resources["source"] != self.resources["target"]))
+        # For each pair of nodes only the first interaction is considered
+        interactions = self.resources[mask].drop_duplicates(subset=["source", "target"])
+
+        if only_signed:
+            interactions = interactions[check_sign_vectorized(interactions, consensus_only) != "undefined"]
+
+        self.add_edges(interactions)
         return
 
     def is_connected(self) -> bool:
         """
-        This function checks if the network is connected. It uses Depth-First Search (DFS) to traverse the network
-        and check if all nodes are visited. If all nodes are visited, the network is connected.
+        This function checks if the network is connected. It builds a sparse adjacency matrix from the edges of the
+        network and counts its (weakly) connected components with `scipy.sparse.csgraph.connected_components`. If
+        there is a single component, the network is connected.
 
         Args:
             - None
 
         Returns:
-            - None
+            - A boolean indicating whether the network is connected.
+
+        """
+
+        n, rows, cols = self._edge_codes()
 
+        # Build the adjacency matrix, skipping the edges whose nodes are not in the network
+        valid = (rows >= 0) & (cols >= 0)
+        rows = rows[valid]
+        cols = cols[valid]
+        data = np.ones_like(rows)
+        mat = csr_matrix((data, (rows, cols)), shape=(n, n))
+
+        n_comp, _ = connected_components(mat, directed=False)
+        return n_comp == 1
+
+    def _sign_index(self, consensus: bool) -> dict:
         """
+        This method returns the dictionary mapping each (source, target) pair of the resources database to the sign
+        of the interaction, see `_build_sign_index`. It is built once for each value of consensus and reset when the
+        resources are reassigned.
 
-        # Create a set to store visited nodes
-        visited = set()
+        Args:
+            - consensus: A boolean indicating whether to check for consensus among references.
 
-        # Function for Depth-First Search
-        def dfs(node):
-            visited.add(node)
-            for neighbour in self.__connect.find_all_neighbours(node):
-                if neighbour not in visited:
-                    dfs(neighbour)
+        Returns:
+            - A dictionary mapping each (source, target) pair to the sign of the interaction.
+        """
+        if consensus not in self._sign_indices:
+            self._sign_indices[consensus] = _build_sign_index(self.resources, consensus)
+        return self._sign_indices[consensus]
 
-        # Start DFS from the first node
-        dfs(self.nodes.iloc[0]['Uniprot'])
+    def _map_path_searches(self, search, tasks: list[tuple], n_jobs: int = 1, consensus: bool = False) -> list[list]:
+        """
+        This method runs a path search function (`_shortest_paths_multi`, `_dfs_paths` or `_bfs_paths`) over a list of
+        nodes or node pairs. The searches are independent, so with n_jobs different from 1 they are
+        distributed over a pool of worker processes, each holding its own copy of the Connections object of the
+        resources database. The results are returned in the order of the tasks.
 
-        # Check if all nodes are visited
-        return set(self.nodes['Uniprot']) == visited
+        Args:
+            - search: The path search function.
+            - tasks: A list of tuples with the arguments of the search function after the Connections object and
+                    the sign index of the resources database.
+            - n_jobs: The number of worker processes. 1 runs the searches in the current process, -1 uses all the
+                    available CPUs. Default is 1.
+            - consensus: A boolean indicating whether to check for consensus among references when filtering the
+                    unsigned paths. Default is False.
+
+        Returns:
+            - A list with the paths found for each task.
+        """
+        sign_index = self._sign_index(consensus)
+        if n_jobs == 1 or len(tasks) < 2:
+            return [search(self.__connect, sign_index, *args) for args in tasks]
+
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        chunksize = max(1, len(tasks) // (4 * max_workers))
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_path_worker,
+                                 initargs=(self.__connect, sign_index)) as executor:
+            return list(executor.map(_run_path_search, [(search, args) for args in tasks], chunksize=chunksize))
+
+    def _search_paths_from(self,
+                           nodes: list[str],
+                           targets: list[str],
+                           maxlen: int,
+                           only_signed: bool,
+                           consensus: bool,
+                           n_jobs: int = 1) -> dict:
+        """
+        This method searches the shortest paths in the resources database from each node of nodes to all the
+        targets, with one traversal of the database for each node instead of one search for each pair of nodes (see
+        `_shortest_paths_multi`).
+
+        Args:
+            - nodes: The Uniprot identifiers of the start nodes.
+            - targets: The Uniprot identifiers of the end nodes.
+            - maxlen: The maximum length of the paths.
+            - only_signed: A boolean flag indicating whether to filter unsigned paths.
+            - consensus: A boolean indicating whether to check for consensus among references.
+            - n_jobs: The number of worker processes, see `_map_path_searches`. Default is 1.
+
+        Returns:
+            - A dictionary mapping each (node, target) pair to the list of the paths found.
+        """
+        tasks = [(node, targets, maxlen, only_signed) for node in nodes]
+        searches = self._map_path_searches(_shortest_paths_multi, tasks, n_jobs, consensus)
+        return {(node, target): paths
+                for node, found in zip(nodes, searches)
+                for target, paths in found.items()}
 
     def __filter_unsigned_paths(self,
                                 paths: list[tuple],
@@ -814,28 +1620,14 @@ class Network:
             - A list[tuple] of paths where all interactions in each path are signed.
         """
 
-        interactions = self.resources
-        filtered_paths = []
-        for path in paths:
-            is_full_signed = True
-            for i in range(0, len(path)):
-                if i == len(path) - 1:
-                    break
-                interaction = interactions.loc[(interactions["source"] == path[i]) &
-                                               (interactions["target"] == path[i + 1])]
-                if not interaction.empty and check_sign(interaction, consensus) == "undefined":
-                    is_full_signed = False
-                    break
-            if is_full_signed:
-                filtered_paths.append(path)
-
-        return filtered_paths
+        return _filter_unsigned_paths(paths, self._sign_index(consensus))
 
     def connect_subgroup(self,
                          group: (str | pd.DataFrame | list[str]),
                          maxlen: int = 1,
                          only_signed: bool = False,
-                         consensus: bool = False
+                         consensus: bool = False,
+                         n_jobs: int = 1
                          ) -> None:
         """
         This function is used to connect all the nodes in a particular subgroup. It iterates over all pairs of nodes
@@ -851,6 +1643,8 @@ class Network:
                             False.
             - consensus: A boolean flag indicating whether to only add signed interactions with consensus among
                             references to the network. Default is False.
+            - n_jobs: The number of worker processes used to search the paths of the different pairs of nodes. 1
+                            runs the searches sequentially, -1 uses all the available CPUs. Default is 1.
 
         Returns:
             - None
@@ -859,29 +1653,21 @@ class Network:
         if not check_gene_list_format(group):
             uniprot_gene_list = group
         else:
-            uniprot_gene_list = [mapping_node_identifier(i)[2] for i in group]
-        if len(uniprot_gene_list) == 1:
+            uniprot_gene_list = [_mapping_node_identifier(i)[2] for i in group]
+        # Drop the duplicated nodes and the nodes absent from the resources database, which have no paths
+        uniprot_gene_list = [node for node in dict.fromkeys(uniprot_gene_list) if node in self._resource_nodes]
+        if len(uniprot_gene_list) < 2:
             print("Number of node insufficient to create connection")
         else:
-            for node1, node2 in combinations(uniprot_gene_list, 2):
-                i = 0
-                paths_in = []
-                paths_out = []
-                while i <= maxlen:
-                    if not paths_out:
-                        paths_out = self.__connect.find_paths(node1, node2, maxlen=i)
-                        if only_signed:
-                            paths_out = self.__filter_unsigned_paths(paths_out, consensus)
-                    if not paths_in:
-                        paths_in = self.__connect.find_paths(node2, node1, maxlen=i)
-                        if only_signed:
-                            paths_in = self.__filter_unsigned_paths(paths_in, consensus)
-                    if not paths_in or not paths_out and i <= maxlen:
-                        i += 1
-                    if (paths_in or paths_out) and i > maxlen or (paths_in and paths_out):
-                        paths = paths_out + paths_in
-                        self.__add_paths_to_edge_list(paths)
-                        break
+            # Search the paths from each node to all the others in one traversal, then collect the paths of all
+            # the pairs, in both directions, and add them to the edge list at once
+            searches = self._search_paths_from(uniprot_gene_list, uniprot_gene_list, maxlen, only_signed, consensus,
+                                               n_jobs)
+            paths = [path
+                     for node1, node2 in combinations(uniprot_gene_list, 2)
+                     for path in searches[(node1, node2)] + searches[(node2, node1)]]
+            if paths:
+                self.__add_paths_to_edge_list(paths)
         return
 
     def dfs_algorithm(self,
@@ -914,21 +1700,8 @@ class Network:
             - None
         """
 
-        i = 1
-        min_len = 1
-        while i <= maxlen:
-            paths = self.__connect.find_paths(start=node1, end=node2, maxlen=i, minlen=min_len)
-            if only_signed:
-                paths = self.__filter_unsigned_paths(paths, consensus)
-            if paths:
-                self.__add_paths_to_edge_list(paths)
-                if connect_with_bias:
-                    self.connect_nodes(only_signed, consensus)
-                    self.edges = self.edges.drop_duplicates().reset_index(drop=True)
-                break
-            else:
-                i += 1
-                min_len += 1
+        paths = _dfs_paths(self.__connect, self._sign_index(consensus), node1, node2, maxlen, only_signed)
+        self.__add_found_paths(paths, only_signed, consensus, connect_with_bias)
 
     def bfs_algorithm(self,
                       node1: str,
@@ -961,14 +1734,23 @@ class Network:
 
         """
 
-        paths = self.__connect.bfs(start=node1, end=node2)
-        if only_signed:
-            paths = self.__filter_unsigned_paths(paths, consensus)
+        paths = _bfs_paths(self.__connect, self._sign_index(consensus), node1, node2, maxlen, only_signed)
+        self.__add_found_paths(paths, only_signed, consensus, connect_with_bias)
+
+    def __add_found_paths(self,
+                          paths: list,
+                          only_signed: bool,
+                          consensus: bool,
+                          connect_with_bias: bool
+                          ) -> None:
+        """
+        This function adds the paths found by `dfs_algorithm` or `bfs_algorithm` to the edge list of the network and,
+        if the `connect_with_bias` flag is set to True, connects the nodes when first introduced.
+        """
         if paths:
             self.__add_paths_to_edge_list(paths)
             if connect_with_bias:
                 self.connect_nodes(only_signed, consensus)
-                self.edges = self.edges.drop_duplicates().reset_index(drop=True)
 
     def complete_connection(self,
                             maxlen: int = 2,
@@ -976,7 +1758,9 @@ class Network:
                             minimal: bool = True,
                             only_signed: bool = False,
                             consensus: bool = False,
-                            connect_with_bias: bool = False
+                            connect_with_bias: bool = False,
+                            n_jobs: int = 1,
+                            verbose: bool = False
                             ) -> None:
         """
         This function attempts to connect all nodes of a network object using one of the methods presented in the
@@ -993,51 +1777,129 @@ class Network:
             - consensus: A boolean flag indicating whether to check for consensus among references. Default is False.
             - connect_with_bias: A boolean flag indicating whether to connect nodes when first
                 introduced. Default is True.
+            - n_jobs: The number of worker processes. If different from 1, the paths of all the pairs of nodes are
+                searched in advance in parallel (-1 uses all the available CPUs), and then added to the network only
+                for the pairs that are still not connected. Default is 1.
+            - verbose: A boolean flag indicating whether to print each node absent from the resources database. If
+                False, a single warning with the number of absent nodes is printed. Default is False.
 
         Returns:
             - None
         """
 
-        # Copy the nodes
-        nodes = self.nodes.copy()
+        # Take the Uniprot identifiers of the nodes once, as a list, so that the loops below do not iterate a Series
+        uniprots = self.nodes["Uniprot"].tolist()
 
         # Create a Connections object for the edges
         connect_network = Connections(self.edges)
+        connected_edges = len(self.edges)
+
+        # Keep only the nodes present in the resources database
+        present = pd.Index(uniprots).isin(self._resource_node_index)
+        missing_nodes = [node for node, is_present in zip(uniprots, present) if not is_present]
+        if verbose:
+            for node in missing_nodes:
+                print("Error: node %s is not present in the resources database" % node)
+        elif missing_nodes:
+            print("Warning: %d nodes are not present in the resources database and will not be connected"
+                  % len(missing_nodes))
+        valid_nodes = [node for node, is_present in zip(uniprots, present) if is_present]
+
+        # Search in advance, in parallel, the paths in the resources database for all the pairs of nodes. The dfs
+        # searches go from each node to all the others in one traversal
+        searches = {}
+        if n_jobs != 1:
+            if algorithm == 'dfs':
+                searches = self._search_paths_from(valid_nodes, valid_nodes, maxlen, only_signed, consensus, n_jobs)
+            else:
+                pairs = list(combinations(valid_nodes, 2))
+                pairs += [(node2, node1) for node1, node2 in pairs]
+                tasks = [(node1, node2, maxlen, only_signed) for node1, node2 in pairs]
+                searches = dict(zip(pairs, self._map_path_searches(_bfs_paths, tasks, n_jobs, consensus)))
+
+        # The nodes reachable from each node in the object connect_network, found with one traversal per node and
+        # dropped when connect_network is updated, so that the pairs already connected by the paths added for the
+        # previous pairs are skipped without a search. If minimal is False, connect_network never changes
+        reachable = {}
 
         # Iterate through all combinations of nodes
-        for node1, node2 in combinations(nodes["Uniprot"], 2):
-            if not self.check_node(node1) or not self.check_node(node2):
-                print(
-                    "Error: node %s is not present in the resources database" % node1 if not self.check_node(
-                        node1) else "Error: node %s is not present in the resources database" % node2)
-                continue
-            i = 0
-            # Reset the object connect_network, updating the possible list of paths if minimal is True
-            if minimal:
-                connect_network = Connections(self.edges)
+        for node1, node2 in combinations(valid_nodes, 2):
+            # Update the object connect_network with the edges added since the last update if minimal is True. The
+            # edges are only appended to the network, so the new edges are the last ones
+            if minimal and len(self.edges) != connected_edges:
+                connect_network.add_edges(self.edges.iloc[connected_edges:])
+                connected_edges = len(self.edges)
+                reachable.clear()
 
             # As first step, make sure that there is at least one path between two nodes in the network
-            paths_in = connect_network.bfs(start=node2, end=node1)
-            paths_out = connect_network.bfs(start=node1, end=node2)
+            for node in (node1, node2):
+                if node not in reachable:
+                    reachable[node] = connect_network.reachable(node)
+            paths_in = node1 in reachable[node2]
+            paths_out = node2 in reachable[node1]
 
             if not paths_in:
-                self.__algorithms[algorithm](node1=node2, node2=node1, maxlen=maxlen, only_signed=only_signed, consensus=consensus, connect_with_bias=connect_with_bias)
+                self.__search_and_add(node2, node1, searches, valid_nodes, algorithm, maxlen, only_signed, consensus,
+                                      connect_with_bias)
             if not paths_out:
-                self.__algorithms[algorithm](node1=node1, node2=node2, maxlen=maxlen, only_signed=only_signed, consensus=consensus, connect_with_bias=connect_with_bias)
+                self.__search_and_add(node1, node2, searches, valid_nodes, algorithm, maxlen, only_signed, consensus,
+                                      connect_with_bias)
 
         # If connect_with_bias is False, connect nodes after all paths have been found
         if not connect_with_bias:
             self.connect_nodes(only_signed, consensus)
-            self.edges = self.edges.drop_duplicates().reset_index(drop=True)
+
+        # Remove the duplicated edges once, after all the pairs have been connected
+        self._drop_duplicated_edges()
         return
 
+    def __search_and_add(self,
+                         node1: str,
+                         node2: str,
+                         searches: dict,
+                         nodes: list[str],
+                         algorithm: Literal['bfs', 'dfs'],
+                         maxlen: int,
+                         only_signed: bool,
+                         consensus: bool,
+                         connect_with_bias: bool
+                         ) -> None:
+        """
+        This function searches the paths from node1 to node2 in the resources database and adds them to the network.
+        It is the step of `complete_connection` for each direction of each pair of nodes. The paths already searched
+        are taken from searches; with the 'dfs' algorithm, the paths from node1 to all the nodes are searched at once
+        the first time node1 is needed, and stored in searches.
+
+        Args:
+            - node1: The Uniprot identifier of the start node.
+            - node2: The Uniprot identifier of the end node.
+            - searches: A dictionary mapping the (start, end) pairs of nodes already searched to their paths.
+            - nodes: The Uniprot identifiers of all the nodes to connect.
+            - algorithm: The search algorithm to be used, 'bfs' or 'dfs'.
+            - maxlen: The maximum length of the paths to be searched for.
+            - only_signed: A boolean flag indicating whether to filter unsigned paths.
+            - consensus: A boolean flag indicating whether to check for consensus among references.
+            - connect_with_bias: A boolean flag indicating whether to connect the nodes when first introduced.
+
+        Returns:
+            - None
+        """
+        if algorithm == 'dfs' and (node1, node2) not in searches:
+            searches.update(self._search_paths_from([node1], nodes, maxlen, only_signed, consensus))
+        if (node1, node2) in searches:
+            self.__add_found_paths(searches[(node1, node2)], only_signed, consensus, connect_with_bias)
+        else:
+            self.__algorithms[algorithm](node1=node1, node2=node2, maxlen=maxlen, only_signed=only_signed,
+                                         consensus=consensus, connect_with_bias=connect_with_bias)
+
     def connect_component(self,
                           comp_A: (str | list[str]),
                           comp_B: (str | list[str]),
                           maxlen: int = 2,
                           mode: Literal['OUT', 'IN', 'ALL'] = 'OUT',
                           only_signed: bool = False,
-                          consensus: bool = False
+                          consensus: bool = False,
+                          n_jobs: int = 1
                           ) -> None:
         """
         This function attempts to connect subcomponents of a network object using one of the methods presented in the
@@ -1051,32 +1913,32 @@ class Network:
             - mode: The search mode, which can be 'OUT', 'IN', or 'ALL'. Default is 'OUT'.
             - only_signed: A boolean flag indicating whether to filter unsigned paths. Default is False.
             - consensus: A boolean flag indicating whether to check for consensus among references. Default is False.
+            - n_jobs: The number of threads enumerating the paths between the two components, see
+                `Connections.iter_paths`, and of worker processes used to connect the nodes outside the two
+                components, see `connect_subgroup`. Default is 1.
 
         Returns:
             - None
 
         """
 
-        # Determine the search mode and find paths accordingly
+        # Determine the search mode and generate the paths accordingly, without building the list of all the paths
         if mode == "IN":
-            paths_in = self.__connect.find_paths(comp_B, comp_A, maxlen=maxlen)
-            paths = paths_in
+            paths = self.__connect.iter_paths(comp_B, comp_A, maxlen=maxlen, n_jobs=n_jobs)
         elif mode == "OUT":
-            paths_out = self.__connect.find_paths(comp_A, comp_B, maxlen=maxlen)
-            paths = paths_out
+            paths = self.__connect.iter_paths(comp_A, comp_B, maxlen=maxlen, n_jobs=n_jobs)
         elif mode == "ALL":
-            paths_out = self.__connect.find_paths(comp_A, comp_B, maxlen=maxlen)
-            paths_in = self.__connect.find_paths(comp_B, comp_A, maxlen=maxlen)
-            paths = paths_out + paths_in
+            paths = chain(self.__connect.iter_paths(comp_A, comp_B, maxlen=maxlen, n_jobs=n_jobs),
+                          self.__connect.iter_paths(comp_B, comp_A, maxlen=maxlen, n_jobs=n_jobs))
         else:
             print("The only accepted modes are IN, OUT or ALL, please check the syntax")
             return
 
         # Filter unsigned paths if the only_signed flag is set
         if only_signed:
-            paths = self.__filter_unsigned_paths(paths, consensus)
+            paths = _iter_signed_paths(paths, self._sign_index(consensus))
 
-        # Add the paths to the edge list
+        # Add the paths to the edge list, consuming the stream of paths
         self.__add_paths_to_edge_list(paths)
 
         # Create sets of nodes for each component and the entire network
@@ -1091,7 +1953,7 @@ class Network:
 
         # If there are nodes not in either component, connect them as a subgroup
         if len(set_c) > 0:
-            self.connect_subgroup(set_c, only_signed=only_signed, maxlen=maxlen)
+            self.connect_subgroup(set_c, only_signed=only_signed, maxlen=maxlen, n_jobs=n_jobs)
 
         return
 
@@ -1100,7 +1962,8 @@ class Network:
                                   depth: int = 1,
                                   rank: int = 1,
                                   only_signed: bool = True,
-                                  consensus: bool = False
+                                  consensus: bool = False,
+                                  verbose: bool = False
                                   ) -> None:
         """
         This function connects the provided nodes to their upstream nodes in the network.
@@ -1111,6 +1974,8 @@ class Network:
             - rank: The rank of the search for upstream nodes.
             - only_signed: A boolean flag indicating whether to filter unsigned paths. Default is True.
             - consensus: A boolean flag indicating whether to check for consensus among references. Default is False.
+            - verbose: A boolean flag indicating whether to print the cascades without interaction in the resources
+                database. Default is False.
 
         Returns:
             - None
@@ -1123,8 +1988,8 @@ class Network:
 
             if only_signed:
                 cascades = self.__filter_unsigned_paths(cascades, consensus)
-            self.__add_cascade_to_edge_list(cascades)
-            self.edges.drop_duplicates().reset_index(drop=True)
+            self.__add_cascade_to_edge_list(cascades, verbose)
+            self._drop_duplicated_edges()
         except Exception as e:
             print(f"An error occurred while connecting to upstream nodes: {e}")
         return
@@ -1148,8 +2013,12 @@ class Network:
 
         gs_edges = self.edges.copy()
 
-        gs_edges["source"] = gs_edges["source"].apply(convert_identifier)
-        gs_edges["target"] = gs_edges["target"].apply(convert_identifier)
+        # Translate each identifier once, then map the source and target columns through the translation dictionary
+        identifiers = pd.unique(np.concatenate([gs_edges["source"].to_numpy(), gs_edges["target"].to_numpy()]))
+        translation = {x: convert_identifier(x) for x in identifiers}
+
+        gs_edges["source"] = gs_edges["source"].map(translation)
+        gs_edges["target"] = gs_edges["target"].map(translation)
 
         return gs_edges
 
@@ -1217,31 +2086,28 @@ class Network:
             phenotype_modified = phenotype.replace(" ", "_")
 
             # Substitute the specified genes with the phenotype name in the nodes dataframe
-            self.nodes['Uniprot'] = self.nodes['Uniprot'].apply(
-                lambda x: phenotype_modified if x in unique_uniprot else x)
-            self.nodes['Genesymbol'] = self.nodes['Genesymbol'].apply(
-                lambda x: phenotype_modified if x in unique_genesymbol else x)
+            self.nodes['Uniprot'] = self.nodes['Uniprot'].mask(
+                self.nodes['Uniprot'].isin(unique_uniprot), phenotype_modified)
+            self.nodes['Genesymbol'] = self.nodes['Genesymbol'].mask(
+                self.nodes['Genesymbol'].isin(unique_genesymbol), phenotype_modified)
+            self._clear_node_cache()
 
             # Substitute the specified genes with the phenotype name in the edges dataframe
             for column in ['source', 'target']:
-                self.edges[column] = self.edges[column].apply(
-                    lambda x: phenotype_modified if x in unique_uniprot else x)
+                self.edges[column] = self.edges[column].mask(self.edges[column].isin(unique_uniprot),
+                                                             phenotype_modified)
 
-            # Group by source and target, and aggregate with the custom function for each column
-            self.edges = self.edges.groupby(['source', 'target']).agg({
-                'Type': join_unique,  # Aggregate types with the custom function
-                'Effect': join_unique,  # Aggregate effects with the custom function
-                'References': join_unique  # Aggregate references with the custom function
-            }).reset_index()
+            # Merge the edges with the same source and target, joining the unique types, effects and references
+            self.edges = merge_edges(self.edges)
 
             # Identify common genes between Uniprot genes and the network's nodes
             common_genes = set(uniprot_genes).intersection(
                 set(uniprot_gene_list if uniprot_gene_list else self.nodes["Uniprot"]))
-            # For each common gene, add a new edge connecting the gene to the phenotype
-            for gene in common_genes:
-                new_edge = {"source": gene, "target": phenotype_modified, "Effect": "stimulation",
-                            "References": "Gene Ontology"}
-                self.edges = self.edges.append(new_edge, ignore_index=True)
+            # For each common gene, add a new edge connecting the gene to the phenotype, all in one concatenation
+            new_edges = [{"source": gene, "target": phenotype_modified, "Effect": "stimulation",
+                          "References": "Gene Ontology"} for gene in common_genes]
+            if new_edges:
+                self.edges = pd.concat([self.edges, pd.DataFrame(new_edges)], ignore_index=True)
         return
 
     def connect_network_radially(self,
@@ -1309,28 +2175,7 @@ class Network:
             i += 1
 
         # remove all nodes that have no source or that have no target and are not in the initial nodes
-        target_nodes = set(self.edges["target"].unique())
-        source_nodes = set(self.edges["source"].unique())
-
-        disconnected_nodes = self.nodes[
-            ~self.nodes["Uniprot"].isin(initial_nodes_set) & (
-                ~self.nodes["Uniprot"].isin(target_nodes) | ~self.nodes["Uniprot"].isin(source_nodes))]
-
-        # Loop until there are no more disconnected nodes
-        while not disconnected_nodes.empty:
-            # Collect nodes to remove
-            nodes_to_remove = disconnected_nodes["Uniprot"].tolist()
-
-            for node in nodes_to_remove:
-                self.remove_node(node)
-
-            # Recalculate disconnected nodes
-            target_nodes = set(self.edges["target"].unique())
-            source_nodes = set(self.edges["source"].unique())
-
-            disconnected_nodes = self.nodes[
-                ~self.nodes["Uniprot"].isin(initial_nodes_set) & (
-                    ~self.nodes["Uniprot"].isin(target_nodes) | ~self.nodes["Uniprot"].isin(source_nodes))]
+        self._remove_dangling_nodes(initial_nodes_set)
 
         return
 
@@ -1396,13 +2241,18 @@ class Network:
             new_nodes = set(self.nodes["Uniprot"].tolist()) - starting_nodes
             new_nodes = new_nodes - set(outputs_uniprot)
 
-            # Remove nodes that do not have a source in the edge dataframe
+            # Remove nodes that do not have a source in the edge dataframe. The targets and the auto-regulated nodes
+            # are looked up in sets; removing a node only drops its own edges, so only the targets are recomputed
+            target_nodes = set(self.edges["target"])
+            self_loops = set(self.edges.loc[self.edges["source"] == self.edges["target"], "source"])
             for node in new_nodes:
-                if node not in self.edges["target"].unique():
+                if node not in target_nodes:
                     self.remove_node(node)
+                    target_nodes = set(self.edges["target"])
                 # remove a node if it auto-regulates itself
-                if not loops and any((self.edges['source'] == node) & (self.edges['target'] == node)):
+                elif not loops and node in self_loops:
                     self.remove_node(node)
+                    target_nodes = set(self.edges["target"])
 
             # If depth reaches 4, stop the process
             if depth == 4:
@@ -1413,7 +2263,7 @@ class Network:
             depth += 1
 
         # Remove duplicate edges
-        self.edges.drop_duplicates().reset_index(drop=True)
+        self._drop_duplicated_edges()
 
         # Create a set of unique sources from the edges DataFrame
         target_nodes = set(self.edges["target"].unique())
@@ -0,0 +1,74 @@
+import pandas as pd
+import pytest
+
+from neko.core import network
+
+# Toy translation table between gene symbols and Uniprot identifiers, used instead of the pypath mapping tables
+GENES = {"A": "P00001", "B": "P00002", "C": "P00003", "D": "P00004",
+         "E": "P00005", "F": "P00006", "G": "P00007", "H": "P00008"}
+UNIPROTS = {uniprot: gene for gene, uniprot in GENES.items()}
+
+
+def _interaction(source, target, stimulation=False, inhibition=False, references="r1"):
+    return {
+        "source": GENES[source],
+        "target": GENES[target],
+        "is_directed": True,
+        "is_stimulation": stimulation,
+        "is_inhibition": inhibition,
+        "form_complex": False,
+        "consensus_direction": True,
+        "consensus_stimulation": stimulation,
+        "consensus_inhibition": inhibition,
+        "curation_effort": 1,
+        "references": references,
+        "sources": "test",
+        "type": "post_translational",
+    }
+
+
+@pytest.fixture(autouse=True)
+def toy_mapping(monkeypatch):
+    """
+    Replace the pypath identifier translations with the toy table, and clear the cached translations around the test.
+    """
+    monkeypatch.setattr(network.mapping, "id_from_label0",
+                        lambda gene: GENES.get(gene, gene if gene in UNIPROTS else None))
+    monkeypatch.setattr(network.mapping, "label",
+                        lambda gene: UNIPROTS.get(gene, gene if gene in GENES else None))
+    network.clear_mapping_cache()
+    yield
+    network.clear_mapping_cache()
+
+
+@pytest.fixture
+def resources():
+    """
+    Small Omnipath-like database of signed and unsigned interactions between the toy genes.
+    """
+    return pd.DataFrame([
+        _interaction("A", "B", stimulation=True),
+        _interaction("A", "B", inhibition=True, references="r3"),
+        _interaction("B", "C", inhibition=True),
+        _interaction("C", "D", stimulation=True),
+        _interaction("A", "C"),
+        _interaction("C", "A", stimulation=True, references="r2"),
+        _interaction("D", "A", stimulation=True, inhibition=True),
+        _interaction("B", "E", stimulation=True),
+        _interaction("E", "D", stimulation=True),
+        _interaction("E", "A", stimulation=True),
+        _interaction("D", "F", stimulation=True),
+        _interaction("F", "G", stimulation=True),
+        _interaction("G", "H", stimulation=True),
+        _interaction("H", "F", stimulation=True),
+    ])
+
+
+@pytest.fixture
+def interaction():
+    """
+    Factory of single Omnipath-like interactions between the toy genes, as accepted by `Network.add_edge`.
+    """
+    def make(source, target, **kwargs):
+        return pd.DataFrame([_interaction(source, target, **kwargs)])
+    return make
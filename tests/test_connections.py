@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from neko._methods import enrichment_methods
+from neko._methods.enrichment_methods import Connections
+
+__all__ = ['TestPathEnumeration', 'TestParallelPaths']
+
+
+def _random_database(seed, n_nodes=9, n_edges=30):
+    rng = np.random.default_rng(seed)
+    sources = rng.integers(0, n_nodes, n_edges)
+    targets = rng.integers(0, n_nodes, n_edges)
+    return pd.DataFrame({"source": ["n%d" % node for node in sources],
+                         "target": ["n%d" % node for node in targets]}).drop_duplicates(ignore_index=True)
+
+
+def _flat_to_paths(flat, offsets):
+    return [flat[i:j].tolist() for i, j in zip(offsets[:-1], offsets[1:])]
+
+
+@pytest.mark.parametrize("seed", range(5))
+class TestPathEnumeration:
+
+    def test_flat_matches_generator(self, seed):
+        indptr, indices, node_index, names = Connections(_random_database(seed))._build_adjacency()
+        for src in range(len(names)):
+            for tgt in range(len(names)):
+                for maxlen, minlen in [(1, 1), (3, 1), (4, 2)]:
+                    expected = enrichment_methods._enumerate_paths(indptr, indices, src, tgt, maxlen, minlen)
+                    flat, offsets = enrichment_methods._enumerate_paths_flat(indptr, indices, src, tgt, maxlen, minlen)
+                    assert _flat_to_paths(flat, offsets) == expected
+
+    def test_jit_matches_python(self, seed):
+        pytest.importorskip("numba")
+        indptr, indices, node_index, names = Connections(_random_database(seed))._build_adjacency()
+        for src in range(len(names)):
+            for tgt in range(len(names)):
+                for maxlen, minlen in [(1, 1), (3, 1), (4, 2)]:
+                    expected = enrichment_methods._enumerate_paths(indptr, indices, src, tgt, maxlen, minlen)
+                    flat, offsets = enrichment_methods._enumerate_paths_jit(indptr, indices, src, tgt, maxlen, minlen)
+                    assert _flat_to_paths(flat, offsets) == expected
+
+    def test_enumerate_paths_matches_recursive_search(self, seed):
+        connections = Connections(_random_database(seed))
+        nodes = sorted(set(connections.resources["source"]) | set(connections.resources["target"]))
+        for start in nodes:
+            for end in nodes:
+                expected = connections._find_paths_recursive(start, end, maxlen=3, minlen=1, loops=False)
+                paths = connections.enumerate_paths(start, end, maxlen=3)
+                assert sorted(map(tuple, paths)) == sorted(map(tuple, expected))
+
+
+class TestParallelPaths:
+
+    def test_iter_paths_n_jobs(self):
+        connections = Connections(_random_database(0))
+        nodes = sorted(set(connections.resources["source"]) | set(connections.resources["target"]))
+        serial = list(connections.iter_paths(nodes, nodes, maxlen=3))
+        parallel = list(connections.iter_paths(nodes, nodes, maxlen=3, n_jobs=2))
+        assert serial
+        assert parallel == serial
@@ -0,0 +1,145 @@
+import pytest
+
+from neko.core import network
+from neko.core.network import Network
+
+__all__ = ['TestSifLoading', 'TestParallelConnection', 'TestEdgeMerging', 'TestNodeCache']
+
+
+def _edge_rows(net):
+    edges = net.edges
+    return sorted(zip(edges["source"], edges["target"], edges["Effect"].astype(str), edges["References"]))
+
+
+class TestSifLoading:
+
+    def test_three_columns(self, resources, tmp_path):
+        sif_file = tmp_path / "network.sif"
+        sif_file.write_text("A\t->\tB\nB\t-|\tC\n")
+        net = Network(sif_file=str(sif_file), resources=resources)
+        assert sorted(net.nodes["Genesymbol"]) == ["A", "B", "C"]
+        assert _edge_rows(net) == [("P00001", "P00002", "stimulation", "SIF file"),
+                                   ("P00002", "P00003", "inhibition", "SIF file")]
+        assert net.edges["Type"].tolist() == [None, None]
+
+    def test_four_columns(self, resources, tmp_path):
+        sif_file = tmp_path / "network.sif"
+        sif_file.write_text("A\t->\tB\tx\n# comment\nB\t-|\tC\tyy\n")
+        net = Network(sif_file=str(sif_file), resources=resources)
+        assert sorted(net.nodes["Genesymbol"]) == ["A", "B", "C"]
+        assert _edge_rows(net) == [("P00001", "P00002", "stimulation", "SIF file"),
+                                   ("P00002", "P00003", "inhibition", "SIF file")]
+        assert net.edges["Type"].tolist() == ["x", "yy"]
+
+
+class TestParallelConnection:
+
+    @pytest.mark.parametrize("kwargs", [dict(maxlen=2, only_signed=True), dict(maxlen=3)])
+    def test_connect_subgroup_n_jobs(self, resources, kwargs):
+        genes = ["A", "C", "D", "E"]
+        serial = Network(genes, resources=resources)
+        serial.connect_subgroup(genes, **kwargs)
+        parallel = Network(genes, resources=resources)
+        parallel.connect_subgroup(genes, n_jobs=2, **kwargs)
+        assert len(serial.edges)
+        assert parallel.edges.equals(serial.edges)
+
+    @pytest.mark.parametrize("kwargs", [dict(maxlen=3, only_signed=True), dict(maxlen=3, minimal=False),
+                                        dict(maxlen=3, algorithm="bfs")])
+    def test_complete_connection_n_jobs(self, resources, kwargs):
+        genes = ["A", "D", "E", "G"]
+        serial = Network(genes, resources=resources)
+        serial.complete_connection(**kwargs)
+        parallel = Network(genes, resources=resources)
+        parallel.complete_connection(n_jobs=2, **kwargs)
+        assert len(serial.edges)
+        assert parallel.edges.equals(serial.edges)
+
+
+class TestEdgeMerging:
+
+    def test_duplicate_in_buffer(self, resources, interaction):
+        net = Network(["A", "B"], resources=resources)
+        net.add_edge(interaction("A", "B", stimulation=True, references="r1"))
+        net.add_edge(interaction("A", "B", stimulation=True, references="r2"))
+        assert _edge_rows(net) == [("P00001", "P00002", "stimulation", "r1; r2")]
+
+    def test_duplicate_across_flush(self, resources, interaction, monkeypatch):
+        monkeypatch.setattr(network, "_EDGE_BUFFER_SIZE", 2)
+        net = Network(["A", "B", "C"], resources=resources)
+        net.add_edge(interaction("A", "B", stimulation=True, references="r1"))
+        net.add_edge(interaction("B", "C", inhibition=True, references="r1"))
+        # The buffer is full, so both edges are written to the edges DataFrame
+        assert not net._edge_buffer
+        net.add_edge(interaction("A", "B", stimulation=True, references="r2"))
+        net.add_edge(interaction("B", "C", inhibition=True, references="r2"))
+        net.add_edge(interaction("A", "B", inhibition=True, references="r3"))
+        assert _edge_rows(net) == [("P00001", "P00002", "inhibition", "r3"),
+                                   ("P00001", "P00002", "stimulation", "r1; r2"),
+                                   ("P00002", "P00003", "inhibition", "r1; r2")]
+
+    def test_duplicate_without_flush(self, resources, interaction):
+        net = Network(["A", "B", "C"], resources=resources)
+        net.add_edge(interaction("A", "B", stimulation=True, references="r1"))
+        net._flush_edges()
+        net.add_edge(interaction("B", "C", inhibition=True, references="r1"), flush=False)
+        net.add_edge(interaction("A", "B", stimulation=True, references="r2"), flush=False)
+        net.add_edge(interaction("B", "C", inhibition=True, references="r2"), flush=False)
+        # The references are merged while the new edge is still buffered
+        assert len(net._edge_buffer) == 1
+        assert _edge_rows(net) == [("P00001", "P00002", "stimulation", "r1; r2"),
+                                   ("P00002", "P00003", "inhibition", "r1; r2")]
+
+    def test_add_edges_merges_existing_edges(self, resources, interaction):
+        net = Network(["A", "B", "C"], resources=resources)
+        net.add_edge(interaction("A", "B", stimulation=True, references="r1"))
+        net._flush_edges()
+        net.add_edges(interaction("A", "B", stimulation=True, references="r2"))
+        assert _edge_rows(net) == [("P00001", "P00002", "stimulation", "r1; r2")]
+
+
+class TestNodeCache:
+
+    def test_remove_node(self, resources, interaction):
+        net = Network(["A", "B", "C"], resources=resources)
+        net.add_edge(interaction("A", "B", stimulation=True))
+        net.add_edge(interaction("B", "C", inhibition=True))
+        assert "P00002" in net._node_uniprots
+        net.remove_node("B")
+        assert "P00002" not in net._node_uniprots
+        assert not any(row[1] == "P00002" for row in net._node_rows)
+        assert net._edge_keys == set()
+        # The node and the edge are added again, since the caches no longer contain them
+        net.add_edge(interaction("A", "B", stimulation=True, references="r2"))
+        assert "B" in set(net.nodes["Genesymbol"])
+        assert _edge_rows(net) == [("P00001", "P00002", "stimulation", "r2")]
+
+    def test_modify_node_name(self, resources):
+        net = Network(["A", "B"], resources=resources)
+        assert ("A", "P00001", "NaN") in net._node_rows
+        net.modify_node_name("A", "A_renamed", type="Genesymbol")
+        assert ("A_renamed", "P00001", "NaN") in net._node_rows
+        assert ("A", "P00001", "NaN") not in net._node_rows
+        # The original gene is not in the cached rows any more, so it is added again
+        net.add_node("A")
+        assert sorted(net.nodes["Genesymbol"]) == ["A", "A_renamed", "B"]
+
+    def test_modify_node_name_uniprot(self, resources, interaction):
+        net = Network(["A", "B"], resources=resources)
+        net.add_edge(interaction("A", "B", stimulation=True))
+        assert net._edge_keys == {("P00001", "P00002", "stimulation")}
+        net.modify_node_name("P00001", "Q00001", type="Uniprot")
+        assert net._node_uniprots == {"Q00001", "P00002"}
+        assert net._edge_keys == {("Q00001", "P00002", "stimulation")}
+
+    def test_copy(self, resources, interaction):
+        net = Network(["A", "B"], resources=resources)
+        net.add_edge(interaction("A", "B", stimulation=True))
+        copy = net.copy()
+        copy.add_edge(interaction("B", "C", inhibition=True))
+        copy.remove_node("A")
+        assert net._node_uniprots == {"P00001", "P00002"}
+        assert net._edge_keys == {("P00001", "P00002", "stimulation")}
+        assert _edge_rows(net) == [("P00001", "P00002", "stimulation", "r1")]
+        assert copy._node_uniprots == {"P00002", "P00003"}
+        assert copy._edge_keys == {("P00002", "P00003", "inhibition")}